@@ -1,16 +1,30 @@
 from __future__ import annotations
 from itertools import zip_longest
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import SimpleQueue, Empty
+from typing import TYPE_CHECKING
+import importlib
 
 from tkinter import *
 from tkinter import simpledialog
 from tkinter import messagebox
 
-from board import Board, Status
+from engine.board import Board, Status
+from card_images import CardImages, CARD_IMAGES, HAND_SIZE, BOARD_SIZE
 from dog.dog_interface import DogPlayerInterface
-from dog.dog_actor import DogActor
+from startup_timer import StartupTimer, FIRST_WINDOW, CONNECTED, BOARD_READY
+
+if TYPE_CHECKING:
+    from dog.async_dog_actor import AsyncDogActor
+    from bots.bot_actor import BotActor
+
+# How often the Tk loop drains events posted by the network and bot threads
+EVENT_POLL_MS = 20
 
 class GUI(DogPlayerInterface):
     def __init__(self) -> GUI:
+        self._startup_timer: StartupTimer = StartupTimer()
         self._main_window: Tk = Tk()
 
         self._menubar: Menu = None
@@ -27,20 +41,119 @@ class GUI(DogPlayerInterface):
         self._current_info: str = "Bem-vindo!\nInicie uma\npartida\nusando o\nmenu"
 
         self._board: Board = Board()
+        self._card_images: CardImages = CARD_IMAGES
+        self.dog_server_interface: AsyncDogActor = None
+        self._bot_actor: BotActor = None
+        self._match_interface = None
+        # Moves the server has not confirmed yet; they go out one at a time, in order, and wait for a resend after a failure
+        self._unsent_moves: deque = deque()
+        self._sending: bool = False
+        self._player_name: str = ""
+        self._offline: bool = False
+
+        # Callbacks from other threads only enqueue; the Tk loop runs them. Network calls run in order on a single worker
+        self._events: SimpleQueue = SimpleQueue()
+        self._network_worker: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+
+        # Move hints are ranked on their own worker from a copy of the board; a newer generation discards older results
+        self._hint_worker: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._hint_generation: int = 0
+
+        # While the name prompt is open, images load on their own worker and the network stack on the network one
+        self._startup_worker: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._startup_worker.submit(self.__warm_up)
+        self._network_worker.submit(self.__load_network)
 
         self.__build_main_window()
         self.__build_menubar()
         self.__build_hand_view()
         self.__build_discard_view()
         self.__build_info_view()
+        self._main_window.update()
+        self._startup_timer.mark(FIRST_WINDOW)
 
         player_name: str = simpledialog.askstring(title="Identificação do jogador", prompt="Qual seu nome?")
-        self.dog_server_interface: DogActor = DogActor()
-        message: str = self.dog_server_interface.initialize(player_name, self)
-        messagebox.showinfo(message=message)
+        self._player_name = player_name if player_name else ""
+        connection = self._network_worker.submit(self.__connect, player_name)
+        self.__wait_connection(connection)
+        self._main_window.after(EVENT_POLL_MS, self.__drain_events)
 
         self._main_window.mainloop()
 
+    def __drain_events(self):
+        try:
+            while True:
+                handler, args = self._events.get_nowait()
+                handler(*args)
+        except Empty:
+            pass
+        finally:
+            self._main_window.after(EVENT_POLL_MS, self.__drain_events)
+
+    def __post_event(self, handler, *args):
+        self._events.put((handler, args))
+
+    def __run_network(self, call, argument, on_done):
+        # on_done receives the finished Future on the Tk thread
+        future = self._network_worker.submit(call, argument)
+        future.add_done_callback(lambda future: self.__post_event(on_done, future))
+
+    def __send_move(self, move: dict):
+        self._unsent_moves.append(move)
+        if not self._sending:
+            self.__send_next_move()
+
+    def __send_next_move(self):
+        self._sending = True
+        self.__run_network(self._match_interface.send_move, self._unsent_moves[0], self.__move_sent)
+
+    def __move_sent(self, future: Future):
+        self._sending = False
+        if future.exception() is not None:
+            self._current_info = "Falha ao\nenviar jogada"
+            self.__update_info_view()
+            if messagebox.askretrycancel("Falha ao enviar jogada", "Não foi possível enviar sua jogada. Tentar novamente?"):
+                self.__send_next_move()
+            return
+        self._unsent_moves.popleft()
+        if self._unsent_moves:
+            self.__send_next_move()
+
+    def resend_moves(self):
+        if self._unsent_moves and not self._sending:
+            self.__send_next_move()
+
+    def __use_interface(self, interface):
+        self._match_interface = interface
+        self._unsent_moves.clear()
+
+    def __warm_up(self):
+        self._card_images.warm_up()
+
+    def __load_network(self):
+        importlib.import_module("aiohttp")
+        importlib.import_module("dog.async_dog_actor")
+
+    def __connect(self, player_name: str) -> (AsyncDogActor, str):
+        from dog.async_dog_actor import AsyncDogActor
+
+        dog_actor = AsyncDogActor()
+        message = dog_actor.initialize(player_name, self)
+        return (dog_actor, message)
+
+    def __wait_connection(self, connection: Future):
+        if not connection.done():
+            self._main_window.after(50, self.__wait_connection, connection)
+            return
+        self._startup_worker.shutdown(wait=False)
+        if connection.exception() is not None:
+            self._offline = True
+            message = "Você está sem conexão"
+        else:
+            self.dog_server_interface, message = connection.result()
+        self._startup_timer.mark(CONNECTED)
+        messagebox.showinfo(message=message)
+
     def __build_menubar(self):
         self._menubar = Menu(self._main_window)
         self._menubar.option_add("tearOff", False)
@@ -50,6 +163,10 @@ class GUI(DogPlayerInterface):
         self._menubar.add_cascade(menu=self.main_menu, label="Principal")
 
         self.main_menu.add_command(label="Iniciar jogo", command=self.start_match)
+        self.main_menu.add_command(label="Iniciar jogo com 3 jogadores", command=lambda: self.start_match(3))
+        self.main_menu.add_command(label="Iniciar jogo em equipes (4 jogadores)", command=lambda: self.start_match(4))
+        self.main_menu.add_command(label="Treinar contra o computador", command=self.start_practice_match)
+        self.main_menu.add_command(label="Reenviar jogada", command=self.resend_moves)
         self.main_menu.add_command(label="Fechar", command=self._main_window.destroy)
 
     def __build_main_window(self):
@@ -82,13 +199,15 @@ class GUI(DogPlayerInterface):
     def __build_board_view(self):
         self._board_view = []
         for index, board_place in enumerate(self._board.board_places):
-            height = board_place.card.image.height()
-            width = board_place.card.image.width()
+            image = self._card_images.image(board_place.card, BOARD_SIZE)
+            height = image.height()
+            width = image.width()
 
             canvas = Canvas(self._board_frame, width=width, height=height)
-            canvas.create_image(0, 0, anchor=NW, image=board_place.card.image, tags="image")
+            canvas.create_image(0, 0, anchor=NW, image=image, tags="image")
             canvas.bind("<Button-1>", lambda event, index=index: self.board_click(event, index))
-            canvas.grid(row=index//10, column=index%10)
+            size = self._board.geometry.size
+            canvas.grid(row=index//size, column=index%size)
 
             self._board_view.append(canvas)
 
@@ -113,10 +232,31 @@ class GUI(DogPlayerInterface):
         self.__update_hand_view()
         self.__update_discard_view()
         self.__update_info_view()
+        self.__update_hints()
         self._main_window.update()
 
+    def __update_hints(self):
+        self._hint_generation += 1
+        for canvas in self._board_view:
+            canvas.delete("hint")
+        if self._board.match_status == Status.YOUR_TURN_BOARD:
+            card = self._board.deck.discard_pile_top()
+            hints = self._hint_worker.submit(self._board.clone().hint_places, card)
+            self.__wait_hints(hints, self._hint_generation)
+
+    def __wait_hints(self, hints: Future, generation: int):
+        if generation != self._hint_generation:
+            hints.cancel()
+        elif not hints.done():
+            self._main_window.after(50, self.__wait_hints, hints, generation)
+        else:
+            for index in hints.result():
+                canvas = self._board_view[index]
+                canvas.create_rectangle(3, 3, int(canvas["width"]) - 2, int(canvas["height"]) - 2,
+                                        outline="yellow", width=4, tags="hint")
+
     def __update_hand_view(self):
-        images = [card.image for card in self._board.local_player.hand]
+        images = [self._card_images.image(card, HAND_SIZE) for card in self._board.local_player.hand]
         for (label, image) in zip_longest(self._hand_view, images, fillvalue=""):
             label.configure(image=image)
 
@@ -125,11 +265,12 @@ class GUI(DogPlayerInterface):
 
         for index, board_place in enumerate(self._board.board_places):
             canvas = self._board_view[index]
+            image = self._card_images.image(board_place.card, BOARD_SIZE)
 
-            canvas.itemconfig("image", image=board_place.card.image)
+            canvas.itemconfig("image", image=image)
 
-            height = board_place.card.image.height()
-            width = board_place.card.image.width()
+            height = image.height()
+            width = image.width()
 
             if board_place.player_in_place is not None:
                 canvas.create_oval(width/2 - chip_radius,
@@ -144,7 +285,7 @@ class GUI(DogPlayerInterface):
     def __update_discard_view(self):
         discard_pile_top = self._board.deck.discard_pile_top()
         if discard_pile_top is not None:
-            self._discard_view[0].configure(image=discard_pile_top.image)
+            self._discard_view[0].configure(image=self._card_images.image(discard_pile_top, HAND_SIZE))
 
     def __update_info_view(self):
         self._info_view[0].configure(text=self._current_info)
@@ -159,7 +300,7 @@ class GUI(DogPlayerInterface):
             self._current_info = info
 
             if move_to_send != {}:
-                self.dog_server_interface.send_move(move_to_send)
+                self.__send_move(move_to_send)
         elif match_status == Status.OPPONENT_TURN:
             self._current_info = "Vez do\noponente"
 
@@ -176,31 +317,59 @@ class GUI(DogPlayerInterface):
             self._current_info = info
 
             if move_to_send != {}:
-                self.dog_server_interface.send_move(move_to_send)
+                self.__send_move(move_to_send)
         elif match_status == Status.OPPONENT_TURN:
             self._current_info = "Vez do\noponente"
 
         self.__update_view()
 
-    def start_match(self):
+    def start_match(self, number_of_players: int = 2):
         match_status = self._board.match_status
 
-        if match_status == Status.STARTING:
+        if self.dog_server_interface is None:
+            messagebox.showinfo(message="Você está sem conexão" if self._offline else "Aguarde a conexão com o servidor")
+        elif match_status == Status.STARTING:
             answer = messagebox.askyesno("INICIAR", "Deseja iniciar uma nova partida?")
             if answer:
-                start_status = self.dog_server_interface.start_match(2)
-                code = start_status.get_code()
-                message = start_status.get_message()
-                if code == "0" or code == "1":
-                    messagebox.showinfo(message=message)
-                else: # code == "2"
-                    players = start_status.get_players()
-                    player_id = start_status.get_local_id()
-                    self._current_info = self._board.start_match(players, player_id)
-                    messagebox.showinfo(message=start_status.get_message())
-
-                    self.__build_board_view()
-                    self.__update_view()
+                self.__run_network(self.dog_server_interface.start_match, number_of_players, self.__match_started)
+
+    def __match_started(self, future: Future):
+        if future.exception() is not None:
+            messagebox.showinfo(message="Voce está offline")
+            return
+        start_status = future.result()
+        code = start_status.get_code()
+        message = start_status.get_message()
+        if code == "0" or code == "1":
+            messagebox.showinfo(message=message)
+        elif self._board.match_status == Status.STARTING: # code == "2"
+            self.__use_interface(self.dog_server_interface)
+            players = start_status.get_players()
+            player_id = start_status.get_local_id()
+            self._current_info = self._board.start_match(players, player_id)
+            messagebox.showinfo(message=start_status.get_message())
+
+            self.__build_board_view()
+            self.__update_view()
+            self.__board_ready()
+
+    def start_practice_match(self):
+        self.start_game()
+        if self._board.match_status == Status.STARTING:
+            if self._bot_actor is None:
+                from bots.bot_actor import BotActor
+
+                self._bot_actor = BotActor()
+                self._bot_actor.initialize(self._player_name, self)
+            start_status = self._bot_actor.start_match(2)
+            self.__use_interface(self._bot_actor)
+            self._current_info = self._board.start_match(start_status.get_players(), start_status.get_local_id())
+            messagebox.showinfo(message=start_status.get_message())
+
+            self.__build_board_view()
+            self.__update_view()
+            self.__board_ready()
+            self._bot_actor.play_if_turn()
 
     def start_game(self):
         match_status = self._board.match_status
@@ -209,20 +378,35 @@ class GUI(DogPlayerInterface):
             self.__update_view()
 
     def receive_start(self, start_status):
+        self.__post_event(self.__start_received, start_status)
+
+    def __start_received(self, start_status):
         self.start_game()
+        self.__use_interface(self.dog_server_interface)
         players = start_status.get_players()
         local_player_id = start_status.get_local_id()
         self._current_info = self._board.start_match(players, local_player_id)
 
         self.__build_board_view()
         self.__update_view()
+        self.__board_ready()
+
+    def __board_ready(self):
+        self._startup_timer.mark(BOARD_READY)
+        self._startup_timer.report_once()
 
     def receive_withdrawal_notification(self):
+        self.__post_event(self.__withdrawal_received)
+
+    def __withdrawal_received(self):
         self._board.receive_withdrawal_notification()
         self._current_info = "Desistência\ndo oponente"
         self.__update_view()
 
     def receive_move(self, move: dict):
+        self.__post_event(self.__move_received, move)
+
+    def __move_received(self, move: dict):
         info = self._board.receive_move(move)
         self._current_info = info
         self.__update_view()
@@ -0,0 +1,174 @@
+from __future__ import annotations
+from time import perf_counter
+
+from engine.board import Board, Status
+from engine.zobrist import TranspositionCache
+from bots.policy import Policy, move_score, position_score
+
+WIN = 1_000_000
+MAX_DEPTH = 64
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+class SearchTimeout(Exception):
+    pass
+
+def is_proven(score: int) -> bool:
+    return abs(score) >= WIN - MAX_DEPTH
+
+def to_table(score: int, ply: int) -> int:
+    # Win scores count plies from the root; the table keeps them relative to the stored position so any ply can reuse them
+    if is_proven(score):
+        return score + ply if score > 0 else score - ply
+    return score
+
+def from_table(score: int, ply: int) -> int:
+    if is_proven(score):
+        return score - ply if score > 0 else score + ply
+    return score
+
+class AlphaBetaSolver:
+    # Alpha-beta over whole turns, searching the position exactly as given (hands and draw pile included).
+    # Scores are for the owner to move at the root, and every other owner plays against it (paranoid search):
+    # with three teams a plain negamax would count a third team's win as a win for the root
+    def __init__(self, time_budget: float = 1.0, max_depth: int = 8, table: TranspositionCache = None) -> AlphaBetaSolver:
+        self._time_budget: float = time_budget
+        self._max_depth: int = max_depth
+        self._table: TranspositionCache = table if table is not None else TranspositionCache()
+        self._deadline: float = 0.0
+        self._nodes: int = 0
+        self._root: int = 0
+
+    @property
+    def nodes(self) -> int:
+        return self._nodes
+
+    def solve(self, board: Board) -> tuple[tuple[int, int], int, int]:
+        # Iterative deepening: returns (move, score for the turn player, deepest completed depth)
+        board = board.clone()
+        self._root = board.owner(board.turn_player)
+        self._deadline = perf_counter() + self._time_budget
+        self._nodes = 0
+        best_move = None
+        best_score = 0
+        completed = 0
+        for depth in range(1, min(self._max_depth, MAX_DEPTH) + 1):
+            try:
+                score, move = self.__search(board, depth, 0, -WIN - 1, WIN + 1)
+            except SearchTimeout:
+                break
+            if move is not None:
+                best_move = move
+                best_score = score
+            completed = depth
+            if is_proven(score):
+                break
+        return (best_move, best_score, completed)
+
+    def __ordered_moves(self, board: Board, tt_move: tuple) -> list[tuple[int, int]]:
+        moves = board.legal_moves()
+        if not moves:
+            moves = [(hand_index, None) for hand_index in board.dead_cards()]
+        # Collapse duplicate cards; completing or blocking a sequence scores highest, so those go first
+        hand = board.turn_player.hand
+        unique = {}
+        for move in moves:
+            unique.setdefault((hand[move[0]], move[1]), move)
+        moves = sorted(unique.values(), key=lambda move: move_score(board, move), reverse=True)
+        if tt_move is not None:
+            card, board_index = tt_move
+            for i, move in enumerate(moves):
+                if hand[move[0]] is card and move[1] == board_index:
+                    moves.insert(0, moves.pop(i))
+                    break
+        return moves
+
+    def __evaluate(self, board: Board) -> int:
+        score = position_score(board, self._root)
+        for other in range(board.owners):
+            if other != self._root:
+                score -= position_score(board, other)
+        return score
+
+    def __search(self, board: Board, depth: int, ply: int, alpha: int, beta: int) -> tuple[int, tuple[int, int]]:
+        self._nodes += 1
+        if self._nodes & 255 == 0 and perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        if board.match_status == Status.FINISHED:
+            # The player who just completed the winning sequence keeps the turn
+            won = board.turn_player.winner and board.owner(board.turn_player) == self._root
+            return (WIN - ply if won else -(WIN - ply), None)
+        if depth == 0:
+            return (self.__evaluate(board), None)
+
+        # Scores depend on the root owner, so a table shared between solves keeps them apart
+        key = (self._root, board.position_key())
+        entry = self._table.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, entry_score, flag, tt_move = entry
+            entry_score = from_table(entry_score, ply)
+            if entry_depth >= depth:
+                if flag == EXACT or (flag == LOWER and entry_score >= beta) or (flag == UPPER and entry_score <= alpha):
+                    return (entry_score, self.__move_from_table(board, tt_move))
+
+        original_alpha = alpha
+        original_beta = beta
+        maximizing = board.owner(board.turn_player) == self._root
+        best_score = -WIN - 1 if maximizing else WIN + 1
+        best_move = None
+        for move in self.__ordered_moves(board, tt_move):
+            board.apply_move(move)
+            try:
+                score = self.__search(board, depth - 1, ply + 1, alpha, beta)[0]
+            finally:
+                board.undo_move()
+            if maximizing:
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+                alpha = max(alpha, score)
+            else:
+                if score < best_score:
+                    best_score = score
+                    best_move = move
+                beta = min(beta, score)
+            if alpha >= beta:
+                break
+
+        flag = EXACT
+        if best_score <= original_alpha:
+            flag = UPPER
+        elif best_score >= original_beta:
+            flag = LOWER
+        hand = board.turn_player.hand
+        self._table.put(key, (depth, to_table(best_score, ply), flag, (hand[best_move[0]], best_move[1]) if best_move else None))
+        return (best_score, best_move)
+
+    def __move_from_table(self, board: Board, tt_move: tuple) -> tuple[int, int]:
+        if tt_move is None:
+            return None
+        card, board_index = tt_move
+        return (board.turn_player.hand.index(card), board_index)
+
+def sharp_position(board: Board) -> bool:
+    # Someone is a single chip away from the sequence that wins the match
+    for owner in range(board.owners):
+        if board.sequences(owner) >= board.sequences_to_win - 1 and board.bitboard.chips_to_sequence(owner) <= 1:
+            return True
+    return False
+
+class AlphaBetaPolicy(Policy):
+    name = "alphabeta"
+
+    def choose_move(self, board: Board) -> tuple[int, int]:
+        # The solver sees whatever it is given, so it searches a guess of the cards the turn player cannot see
+        state = board.clone()
+        state.determinize(state.turn_player, self._random)
+        move = AlphaBetaSolver(self._time_budget).solve(state)[0]
+        if move is None:
+            moves = board.legal_moves()
+            return self._random.choice(moves) if moves else self.fallback_move(board)
+        return move
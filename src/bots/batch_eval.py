@@ -0,0 +1,59 @@
+from __future__ import annotations
+import numpy as np
+
+from engine.board import Board, EMPTY_CELL, JOKER_CELL
+from engine.board_geometry import BoardGeometry, GEOMETRY
+from bots.policy import WINDOW_WEIGHTS, SEQUENCE_WEIGHT
+
+def stack_grids(boards: list[Board]) -> np.ndarray:
+    # (batch, cells) array of Board.chip_grid codes
+    return np.array([board.chip_grid() for board in boards], dtype=np.int8)
+
+def stack_sequences(boards: list[Board]) -> np.ndarray:
+    # (batch, owners) completed sequences; a grid cannot tell them apart from longer lines, so they come from the boards
+    return np.array([[board.sequences(owner) for owner in range(board.owners)] for board in boards], dtype=np.int64)
+
+class BatchEvaluator():
+    # Scores many stored positions at once (snapshots, simulator logs): every window of every grid is gathered into one array
+    # and reduced along its cells. Search leaves stay on position_values: the incremental BitBoard counters score one board
+    # in a few microseconds, while building its grid alone costs more than that
+    def __init__(self, geometry: BoardGeometry = GEOMETRY, owners: int = 2) -> BatchEvaluator:
+        self._geometry: BoardGeometry = geometry
+        self._owners: int = owners
+        self._windows: np.ndarray = np.array(geometry.window_cells, dtype=np.intp)
+        self._counts: np.ndarray = np.arange(geometry.sequence_length + 1)
+        self._weights: np.ndarray = np.array(WINDOW_WEIGHTS[:geometry.sequence_length], dtype=np.int64)
+
+    @property
+    def geometry(self) -> BoardGeometry:
+        return self._geometry
+
+    def open_windows(self, grids: np.ndarray) -> np.ndarray:
+        # (batch, owners, sequence_length + 1): per owner, windows free of opponent chips holding 0..L owned-or-joker cells,
+        # the same histogram BitBoard.open_windows keeps for a single board
+        cells = np.asarray(grids)[:, self._windows]
+        jokers = cells == JOKER_CELL
+        occupied = (cells != EMPTY_CELL) & ~jokers
+        histograms = np.empty((cells.shape[0], self._owners, len(self._counts)), dtype=np.int64)
+        for owner in range(self._owners):
+            owned = cells == owner + 1
+            is_open = ~(occupied & ~owned).any(axis=2)
+            counts = (owned | jokers).sum(axis=2)
+            histograms[:, owner] = ((counts[:, :, None] == self._counts) & is_open[:, :, None]).sum(axis=1)
+        return histograms
+
+    def threats(self, grids: np.ndarray) -> np.ndarray:
+        # (batch, owners, sequence_length - 1): open windows with 1..L-1 cells
+        return self.open_windows(grids)[:, :, 1:-1]
+
+    def scores(self, grids: np.ndarray, sequences: np.ndarray) -> np.ndarray:
+        # (batch, owners) position_score for every grid, given the sequences each owner has made
+        histograms = self.open_windows(grids)
+        return histograms[:, :, :-1] @ self._weights + np.asarray(sequences, dtype=np.int64) * SEQUENCE_WEIGHT
+
+    def count_boards(self, boards: list[Board]) -> tuple[np.ndarray, np.ndarray]:
+        # Per owner threats (open windows with 1..L-1 cells) and completed sequences of every board
+        return (self.threats(stack_grids(boards)), stack_sequences(boards))
+
+    def score_boards(self, boards: list[Board]) -> np.ndarray:
+        return self.scores(stack_grids(boards), stack_sequences(boards))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from threading import Thread, Lock
+from random import Random
+import os
+
+from engine.board import Board, Status
+from bots.policy import Policy
+from bots.mcts import MCTSPolicy
+from dog.start_status import StartStatus
+
+class BotActor:
+    # Stands in for DogActor: the bot plays the remote seat on its own replica of the match
+    def __init__(self, policy: Policy = None):
+        super().__init__()
+        self._policy: Policy = policy if policy is not None else MCTSPolicy(time_budget=1.5, workers=os.cpu_count())
+        self._board: Board = Board()
+        self._lock: Lock = Lock()
+        self._thinking: bool = False
+        self._random: Random = Random()
+        self.player_actor = None
+        self.player_name = ""
+        self.bot_name = "Computador"
+
+    def initialize(self, player_name, a_player_actor):
+        self.player_actor = a_player_actor
+        self.player_name = player_name if player_name else "Jogador"
+        Thread(target=self._policy.warm_up, daemon=True).start()
+        return "Modo treino contra o computador"
+
+    def start_match(self, number_of_players):
+        player_id = str(self._random.randrange(1, 10 ** 9))
+        bot_id = str(self._random.randrange(1, 10 ** 9))
+        bot_first = self._random.random() < 0.5
+        player_order, bot_order = ("2", "1") if bot_first else ("1", "2")
+
+        # Each side lists itself first, as the DOG server does
+        with self._lock:
+            self._board.reset_game()
+            self._board.start_match([[self.bot_name, bot_id, bot_order], [self.player_name, player_id, player_order]], bot_id)
+        players = [[self.player_name, player_id, player_order], [self.bot_name, bot_id, bot_order]]
+        return StartStatus("2", "Partida de treino iniciada", players, player_id)
+
+    def send_move(self, move):
+        with self._lock:
+            self._board.receive_move(move)
+        self.play_if_turn()
+
+    def play_if_turn(self):
+        with self._lock:
+            if self._thinking or self._board.match_status != Status.YOUR_TURN_CARD:
+                return
+            self._thinking = True
+        Thread(target=self.__play_turn, daemon=True).start()
+
+    def __play_turn(self):
+        try:
+            while True:
+                with self._lock:
+                    if self._board.match_status != Status.YOUR_TURN_CARD:
+                        break
+                    hand_index, board_index = self._policy.choose_move(self._board)
+                    moves = [self._board.pick_card(hand_index)[0]]
+                    if board_index is not None:
+                        moves.append(self._board.select_board_place(board_index)[0])
+                for move in moves:
+                    self.player_actor.receive_move(move)
+        finally:
+            with self._lock:
+                self._thinking = False
+
+    def close(self):
+        self._policy.close()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from math import log, sqrt
+from random import Random
+from time import perf_counter
+import os
+
+from engine.board import Board, Status
+from bots.policy import Policy, move_score, position_values
+from bots.alphabeta import AlphaBetaSolver, sharp_position, is_proven, WIN
+
+MAX_BRANCHING = 16
+ROLLOUT_TURNS = 16
+ITERATIONS_PER_DETERMINIZATION = 48
+SOLVER_SHARE = 0.3
+SOLVER_DETERMINIZATIONS = 3
+
+def candidate_moves(board: Board) -> list[tuple[int, int]]:
+    # Legal moves with duplicate cards collapsed, best MAX_BRANCHING last so pop() expands them first
+    seen = set()
+    moves = []
+    hand = board.turn_player.hand
+    for move in board.legal_moves():
+        key = (hand[move[0]], move[1])
+        if key not in seen:
+            seen.add(key)
+            moves.append(move)
+    if not moves:
+        for hand_index in board.dead_cards():
+            if hand[hand_index] not in seen:
+                seen.add(hand[hand_index])
+                moves.append((hand_index, None))
+        return moves
+    moves.sort(key=lambda move: move_score(board, move))
+    return moves[-MAX_BRANCHING:]
+
+class Node:
+    __slots__ = ("move", "parent", "owner", "children", "untried", "visits", "value")
+
+    def __init__(self, move: tuple[int, int], parent: Node, owner: int, untried: list) -> Node:
+        self.move = move
+        self.parent = parent
+        self.owner = owner
+        self.children: list[Node] = []
+        self.untried: list[tuple[int, int]] = untried
+        self.visits: int = 0
+        self.value: float = 0.0
+
+    def select(self, exploration: float) -> Node:
+        log_visits = log(self.visits)
+        return max(self.children, key=lambda child: child.value / child.visits + exploration * sqrt(log_visits / child.visits))
+
+def rollout(board: Board, random: Random) -> list[float]:
+    played = 0
+    turns = 0
+    while board.match_status != Status.FINISHED and turns < ROLLOUT_TURNS:
+        moves = board.legal_moves()
+        if moves:
+            move = random.choice(moves)
+            turns += 1
+        else:
+            move = (random.choice(board.dead_cards()), None)
+        board.apply_move(move)
+        played += 1
+    values = position_values(board)
+    for i in range(played):
+        board.undo_move()
+    return values
+
+def iterate(board: Board, root: Node, random: Random, exploration: float):
+    node = root
+    depth = 0
+    while not node.untried and node.children:
+        node = node.select(exploration)
+        board.apply_move(node.move)
+        depth += 1
+
+    if node.untried and board.match_status != Status.FINISHED:
+        move = node.untried.pop()
+        owner = board.owner(board.turn_player)
+        board.apply_move(move)
+        depth += 1
+        untried = candidate_moves(board) if board.match_status != Status.FINISHED else []
+        child = Node(move, node, owner, untried)
+        node.children.append(child)
+        node = child
+
+    values = rollout(board, random)
+    while node is not None:
+        node.visits += 1
+        if node.owner is not None:
+            node.value += values[node.owner]
+        node = node.parent
+    for i in range(depth):
+        board.undo_move()
+
+def search(board: Board, seconds: float, seed: int, exploration: float = 0.7) -> dict[tuple[int, int], int]:
+    # Runs UCT on successive determinizations of the hidden cards and sums the root visits per move
+    random = Random(seed)
+    deadline = perf_counter() + seconds
+    viewer = board.turn_player
+    visits = {}
+    while perf_counter() < deadline:
+        state = board.clone()
+        state.determinize(state.players[board.players.index(viewer)], random)
+        root = Node(None, None, None, candidate_moves(state))
+        for i in range(ITERATIONS_PER_DETERMINIZATION):
+            if perf_counter() >= deadline:
+                break
+            iterate(state, root, random, exploration)
+        for child in root.children:
+            visits[child.move] = visits.get(child.move, 0) + child.visits
+    return visits
+
+class MCTSPolicy(Policy):
+    name = "mcts"
+
+    def __init__(self, seed: int = None, time_budget: float = 1.5, workers: int = 1) -> MCTSPolicy:
+        super().__init__(seed, time_budget)
+        self._workers: int = workers if workers is not None else os.cpu_count()
+        self._pool: ProcessPoolExecutor = None
+
+    def __pool(self) -> ProcessPoolExecutor:
+        # spawn keeps the workers free of the caller's threads; they re-import the main script, which must guard its entry point
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self._workers, mp_context=get_context("spawn"))
+        return self._pool
+
+    def warm_up(self):
+        if self._workers > 1:
+            self.__pool().submit(len, ()).result()
+
+    def choose_move(self, board: Board) -> tuple[int, int]:
+        moves = candidate_moves(board)
+        if len(moves) == 1:
+            return moves[0]
+
+        state = board.clone()
+        time_budget = self._time_budget
+        if sharp_position(state):
+            # One chip from the winning sequence. A win this turn needs no hidden card; a deeper one is only played
+            # when the solver proves the same move on every guess of the hidden cards, else sample as usual
+            proven = set()
+            for i in range(SOLVER_DETERMINIZATIONS):
+                solver = AlphaBetaSolver(time_budget * SOLVER_SHARE / SOLVER_DETERMINIZATIONS)
+                solver_state = board.clone()
+                solver_state.determinize(solver_state.turn_player, self._random)
+                move, score, depth = solver.solve(solver_state)
+                if move is None or not is_proven(score) or score < 0:
+                    proven.clear()
+                    break
+                if score == WIN - 1:
+                    return move
+                proven.add(move)
+            if len(proven) == 1:
+                return proven.pop()
+            time_budget -= time_budget * SOLVER_SHARE
+
+        if self._workers > 1:
+            seeds = [self._random.getrandbits(64) for i in range(self._workers)]
+            futures = [self.__pool().submit(search, state, time_budget, seed) for seed in seeds]
+            visits = {}
+            for future in futures:
+                for move, count in future.result().items():
+                    visits[move] = visits.get(move, 0) + count
+        else:
+            visits = search(state, time_budget, self._random.getrandbits(64))
+
+        if not visits:
+            return moves[-1]
+        return max(visits, key=visits.get)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,99 @@
+from __future__ import annotations
+from random import Random
+from math import exp
+
+from engine.board import Board
+
+# Weight of a window holding 0..5 of a player's cells, used to value advancing or blocking it
+WINDOW_WEIGHTS = (0, 1, 4, 16, 64, 1024)
+JACK_PENALTY = 8
+SEQUENCE_WEIGHT = 2048
+VALUE_SCALE = 256
+
+class Policy:
+    name = "policy"
+
+    def __init__(self, seed: int = None, time_budget: float = 1.0) -> Policy:
+        self._random: Random = Random(seed)
+        self._time_budget: float = time_budget
+
+    @property
+    def time_budget(self) -> float:
+        return self._time_budget
+
+    def close(self):
+        pass
+
+    def choose_move(self, board: Board) -> tuple[int, int]:
+        raise NotImplementedError
+
+    def fallback_move(self, board: Board) -> tuple[int, int]:
+        # With no placement left, the turn player must discard a dead card
+        return (self._random.choice(board.dead_cards()), None)
+
+class RandomPolicy(Policy):
+    name = "random"
+
+    def choose_move(self, board: Board) -> tuple[int, int]:
+        moves = board.legal_moves()
+        if not moves:
+            return self.fallback_move(board)
+        return self._random.choice(moves)
+
+def move_score(board: Board, move: tuple[int, int]) -> int:
+    hand_index, board_index = move
+    if board_index is None:
+        return 0
+    bitboard = board.bitboard
+    owner = board.owner(board.turn_player)
+    card = board.turn_player.hand[hand_index]
+    score = 0
+    if card.is_one_eye_jack():
+        # Removing a chip is worth the opponent windows it breaks
+        opponent = board.owner(board.board_places[board_index].player_in_place)
+        counts = bitboard.counts(opponent)
+        for window in board.geometry.windows(board_index):
+            if bitboard.is_open(window, opponent):
+                score += WINDOW_WEIGHTS[counts[window]]
+        return score - JACK_PENALTY
+    counts = bitboard.counts(owner)
+    for window in board.geometry.windows(board_index):
+        if bitboard.is_open(window, owner):
+            score += WINDOW_WEIGHTS[counts[window] + 1]
+        for opponent in range(board.owners):
+            if opponent != owner and bitboard.is_open(window, opponent):
+                score += WINDOW_WEIGHTS[bitboard.counts(opponent)[window]]
+    if card.is_two_eyes_jack():
+        score -= JACK_PENALTY
+    return score
+
+def position_score(board: Board, owner: int) -> int:
+    # Sequences made plus every still-open window weighted by how full it is
+    open_windows = board.bitboard.open_windows(owner)
+    score = board.sequences(owner) * SEQUENCE_WEIGHT
+    for count in range(len(open_windows) - 1):
+        score += open_windows[count] * WINDOW_WEIGHTS[count]
+    return score
+
+def position_values(board: Board) -> list[float]:
+    # Per owner, a win probability estimate in [0, 1]
+    owners = range(board.owners)
+    if any(player.winner for player in board.players):
+        return [1.0 if board.team(owner)[0].winner else 0.0 for owner in owners]
+    scores = [position_score(board, owner) for owner in owners]
+    values = []
+    for owner, score in enumerate(scores):
+        best_other = max(s for other, s in enumerate(scores) if other != owner)
+        values.append(1 / (1 + exp(-(score - best_other) / VALUE_SCALE)))
+    return values
+
+class GreedyPolicy(Policy):
+    name = "greedy"
+
+    def choose_move(self, board: Board) -> tuple[int, int]:
+        moves = board.legal_moves()
+        if not moves:
+            return self.fallback_move(board)
+        scores = [move_score(board, move) for move in moves]
+        best = max(scores)
+        return self._random.choice([move for move, score in zip(moves, scores) if score == best])
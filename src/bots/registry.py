@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from bots.policy import Policy, RandomPolicy, GreedyPolicy
+from bots.mcts import MCTSPolicy
+from bots.alphabeta import AlphaBetaPolicy
+
+POLICIES: dict[str, type] = {
+    RandomPolicy.name: RandomPolicy,
+    GreedyPolicy.name: GreedyPolicy,
+    MCTSPolicy.name: MCTSPolicy,
+    AlphaBetaPolicy.name: AlphaBetaPolicy,
+}
+
+def make_policy(name: str, seed: int = None, time_budget: float = None) -> Policy:
+    if time_budget is None:
+        return POLICIES[name](seed)
+    return POLICIES[name](seed, time_budget)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from os import path
+from threading import Lock
+from tkinter import PhotoImage
+
+from engine.card import Card, Suit, CARDS
+from sprite_atlas import SpriteAtlas, load_atlas
+
+IMG_DIR = path.join(path.dirname(path.abspath(__file__)), "..", "img")
+HAND_SIZE = (120,174)
+BOARD_SIZE = (60,87)
+SIZES = (HAND_SIZE, BOARD_SIZE)
+
+def image_file(card: Card) -> str:
+    if card.suit == Suit.JOKER:
+        return "black_joker.png"
+    return str(card.number).zfill(2) + "_of_" + card.suit.value + ".png"
+
+class CardImages:
+    def __init__(self) -> CardImages:
+        self._images: dict[tuple[str, tuple[int, int]], PhotoImage] = {}
+        self._atlas: SpriteAtlas = None
+        self._atlas_loaded: bool = False
+        self._atlas_lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    @property
+    def atlas(self) -> SpriteAtlas:
+        with self._atlas_lock:
+            if not self._atlas_loaded:
+                try:
+                    self._atlas = load_atlas(IMG_DIR, SIZES)
+                except (OSError, ValueError, ImportError) as error:
+                    print("Atlas de cartas indisponível: " + str(error))
+                self._atlas_loaded = True
+        return self._atlas
+
+    def warm_up(self):
+        # Safe off the Tk thread: only opens the atlas and pages its sprites in, PhotoImages are created on demand
+        atlas = self.atlas
+        if atlas is not None:
+            for size in SIZES:
+                for card in CARDS:
+                    atlas.blob(image_file(card), size)
+
+    def __load(self, file: str, size: tuple[int, int]):
+        atlas = self.atlas
+        if atlas is not None and atlas.has(file, size):
+            self._images[(file, size)] = PhotoImage(data=atlas.blob(file, size))
+            return
+
+        from PIL import Image, ImageTk
+
+        # Decode the full-size PNG once and resize it to every size the GUI uses
+        with Image.open(path.join(IMG_DIR, file)) as source:
+            for s in set(SIZES + (size,)):
+                if (file, s) not in self._images:
+                    self._images[(file, s)] = ImageTk.PhotoImage(source.resize(s))
+
+    def get(self, file: str, size: tuple[int, int]) -> PhotoImage:
+        key = (file, size)
+        if key not in self._images:
+            self.__load(file, size)
+        return self._images[key]
+
+    def image(self, card: Card, size: tuple[int, int]) -> PhotoImage:
+        return self.get(image_file(card), size)
+
+CARD_IMAGES = CardImages()
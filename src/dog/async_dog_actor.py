@@ -0,0 +1,53 @@
+import asyncio
+from threading import Thread, Lock
+from dog.async_dog_proxy import AsyncDogProxy
+
+_loop = None
+_loop_lock = Lock()
+
+
+def event_loop():
+    # One event loop on a daemon thread per process, shared by every AsyncDogActor
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            Thread(target=_loop.run_forever, daemon=True).start()
+    return _loop
+
+
+class AsyncDogActor:
+    # Same interface as DogActor, backed by AsyncDogProxy: no polling thread, and moves arrive as soon as they are polled
+    def __init__(self, loop=None, url=None):
+        super().__init__()
+        self.loop = loop if loop is not None else event_loop()
+        self.proxy = AsyncDogProxy(url=url)
+        self.player_actor = None
+        self.poller = None
+
+    def call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def initialize(self, player_name, a_player_actor):
+        self.player_actor = a_player_actor
+        resp_dict = self.call(self.proxy.initialize(player_name, self))
+        self.poller = asyncio.run_coroutine_threadsafe(self.proxy.poll(), self.loop)
+        return resp_dict
+
+    def start_match(self, number_of_players):
+        return self.call(self.proxy.start_match(number_of_players))
+
+    def send_move(self, move):
+        self.call(self.proxy.send_move(move))
+
+    def receive_start(self, start_status):
+        self.player_actor.receive_start(start_status)
+
+    def receive_move(self, a_move):
+        self.player_actor.receive_move(a_move)
+
+    def receive_withdrawal_notification(self):
+        self.player_actor.receive_withdrawal_notification()
+
+    def close(self):
+        self.call(self.proxy.close())
@@ -0,0 +1,200 @@
+import asyncio
+import ast
+import json
+import aiohttp
+from dog.dog_proxy import CONNECT_TIMEOUT, READ_TIMEOUT, RETRIES, BACKOFF_FACTOR, RETRY_STATUS, server_url
+from dog.start_status import StartStatus
+
+# Poll interval in seconds: right after a move is sent or received it drops to POLL_MIN, then grows by POLL_BACKOFF while nothing arrives
+POLL_MIN = 0.02
+POLL_MAX = 1.0
+POLL_BACKOFF = 1.5
+
+
+class AsyncDogProxy:
+    # Coroutine version of DogProxy and PollingThread: many proxies can share one event loop and one connection pool
+    def __init__(self, session=None, url=None):
+        super().__init__()
+        self.dog_actor = None
+        self.player_id = 0
+        self.player_name = ""
+        self.game_id = 0
+        self.status = 0
+        # 0 - file game.id not found; 1 - not connected to server; 2 - connected without match; 3 - waiting move (even if it's the local player's turn)
+        self.move_order = 0
+        self.url = server_url(url)
+        self.session = session
+        self.owns_session = session is None
+        self.wake = None
+        self.closed = False
+
+    def get_status(self):
+        return self.status
+
+    async def post(self, path, post_data, retry_read=True):
+        if self.session is None:
+            timeout = aiohttp.ClientTimeout(sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT)
+            self.session = aiohttp.ClientSession(timeout=timeout)
+        delay = BACKOFF_FACTOR
+        for attempt in range(RETRIES + 1):
+            try:
+                async with self.session.post(self.url + path, data=post_data) as resp:
+                    text = await resp.text()
+                    if resp.status not in RETRY_STATUS or not retry_read or attempt == RETRIES:
+                        return (resp.status, text)
+            except aiohttp.ClientConnectorError:
+                if attempt == RETRIES:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # The request may have reached the server: only retry when that is harmless
+                if not retry_read or attempt == RETRIES:
+                    raise
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    async def close(self):
+        self.closed = True
+        if self.wake is not None:
+            self.wake.set()
+        if self.owns_session and self.session is not None:
+            await self.session.close()
+
+    async def initialize(self, a_name, an_actor):
+        self.player_id = self.generate_player_id()
+        self.player_name = a_name
+        self.dog_actor = an_actor
+        if self.player_name == "":
+            self.player_name = "player" + str(self.player_id)
+        try:
+            config_file = open("config/game.id", "r")
+            self.game_id = config_file.read()
+        except FileNotFoundError:
+            self.status = 0
+            return "Arquivo de configuração do jogo não encontrado"
+        config_file.close()
+        try:
+            result, resp_json = await self.register_player(self.player_name, self.player_id, self.game_id)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            result = 0
+        if result == 200:
+            self.status = 2
+            message = "Conectado a Dog Server"
+        else:
+            self.status = 1
+            message = "Você está sem conexão"
+        return message
+
+    def generate_player_id(self):
+        from time import time
+
+        milliseconds = int(time() * 1000)
+        an_id = str(milliseconds - 1639872000000)
+        return an_id
+
+    async def register_player(self, a_player_name, a_player_id, a_game_id):
+        post_data = {"player_name": a_player_name, "player_id": a_player_id, "game_id": a_game_id}
+        return await self.post("player/", post_data)
+
+    async def start_match(self, number_of_players):
+        post_data = {"player_id": self.player_id, "game_id": self.game_id, "number_of_players": number_of_players}
+        try:
+            result, resp_json = await self.post("start/", post_data, retry_read=False)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            result = 0
+        if result == 200:
+            resp_dict = json.loads(resp_json)
+            message = resp_dict["message"]
+            code = resp_dict["code"]
+            players = resp_dict["players"]
+            start_status = StartStatus(code, message, players, self.player_id)
+            if code == "2":
+                self.status = 3
+                self.move_order = 0
+                self.wake_up()
+        else:
+            start_status = StartStatus("0", "Voce está offline", [], self.player_id)
+        return start_status
+
+    async def start_status(self):
+        # True when the match has started
+        post_data = {"player_id": self.player_id, "game_id": self.game_id}
+        result, resp_json = await self.post("started/", post_data, retry_read=False)
+        if result == 200 and self.status == 2:
+            resp_dict = json.loads(resp_json)
+            message = resp_dict["message"]
+            code = resp_dict["code"]
+            players = resp_dict["players"]
+            if code == "2":
+                start_status = StartStatus(code, message, players, self.player_id)
+                self.status = 3
+                self.move_order = 0
+                self.dog_actor.receive_start(start_status)
+                return True
+        return False
+
+    async def send_move(self, a_move):
+        json_move = json.dumps(a_move)  # convert move to json
+        post_data = {"player_id": self.player_id, "game_id": self.game_id, "move": json_move}
+        # Failures reach the caller, which still holds the move and can send it again
+        result, text = await self.post("move/", post_data, retry_read=False)
+        if result != 200:
+            raise aiohttp.ClientError("move/ respondeu " + str(result))
+        if a_move["match_status"] == "next":
+            self.status = 3  #   pass the turn and start looking for a move
+            self.wake_up()
+        elif a_move["match_status"] == "finished":
+            self.status = 2  #   connected without match
+        return text
+
+    async def match_status(self):
+        # True when a new move (or a withdrawal) was handed to the actor
+        # move_order acknowledges every move handled so far. The local dog_server.py then keeps later moves queued until
+        # they are acknowledged, so a repeated poll gets the same move again; the real server pops each move it answers with
+        post_data = {"player_id": self.player_id, "game_id": self.game_id, "move_order": self.move_order}
+        result, resp_json = await self.post("match/", post_data, retry_read=False)
+        seek_result = json.loads(resp_json)
+        if bool(seek_result):
+            move_dictionary = ast.literal_eval(
+                seek_result["1"]
+            )  #   move is contained in seek_result as a string (to be converted in dictionary)
+            if bool(move_dictionary):
+                match_status = move_dictionary["match_status"]
+                if match_status == "interrupted":  #  an opponent has abandoned the match
+                    self.dog_actor.receive_withdrawal_notification()
+                    self.status = 2
+                    return True
+                move_player_id = move_dictionary["player"]
+                move_player_order = move_dictionary["order"]
+                if move_player_id != str(self.player_id):  #  not from the player himself
+                    if int(move_player_order) > self.move_order:  #  not an already handled move
+                        self.move_order = int(move_player_order)
+                        self.dog_actor.receive_move(move_dictionary)
+                        if move_dictionary["match_status"] == "finished":
+                            self.status = 2
+                        return True
+        return False
+
+    def wake_up(self):
+        # Poll again right away: the next remote move is likely close
+        if self.wake is not None:
+            self.wake.set()
+
+    async def poll(self):
+        self.wake = asyncio.Event()
+        interval = POLL_MIN
+        while not self.closed:
+            received = False
+            try:
+                if self.status == 2:  #   connected without match
+                    received = await self.start_status()
+                elif self.status == 3:  #   waiting remote move
+                    received = await self.match_status()
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                pass  #   asked again on the next round
+            interval = POLL_MIN if received else min(interval * POLL_BACKOFF, POLL_MAX)
+            try:
+                await asyncio.wait_for(self.wake.wait(), interval)
+                interval = POLL_MIN
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
@@ -3,9 +3,9 @@ from dog.polling_thread import PollingThread
 
 
 class DogActor:
-    def __init__(self):
+    def __init__(self, url=None):
         super().__init__()
-        self.proxy = DogProxy()
+        self.proxy = DogProxy(url)
         self.player_actor = None
         self.polling_thread = PollingThread(self.proxy, True)
 
@@ -1,12 +1,30 @@
-from distutils.command.config import config
 import json
+import os
 from urllib.parse import urldefrag
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dog.start_status import StartStatus
 
+# Seconds to open the connection and to wait for each response
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10
+# Bounded retries with exponential backoff (0.5s, 1s, 2s) on connection errors; requests that are harmless to repeat
+# (AsyncDogProxy's player registration) are also retried on read errors and gateway failures
+RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUS = (502, 503, 504)
+# DOG_SERVER_URL points the clients elsewhere, e.g. at a local dog_server.py
+DEFAULT_URL = "https://api-dog-server.herokuapp.com/"
+
+
+def server_url(url=None):
+    url = url or os.environ.get("DOG_SERVER_URL") or DEFAULT_URL
+    return url if url.endswith("/") else url + "/"
+
 
 class DogProxy:
-    def __init__(self):
+    def __init__(self, url=None):
         super().__init__()
         self.dog_actor = None
         self.player_id = 0
@@ -15,7 +33,24 @@ class DogProxy:
         self.status = 0
         # 0 - file game.id not found; 1 - not connected to server; 2 - connected without match; 3 - waiting move (even if it's the local player's turn)
         self.move_order = 0
-        self.url = "https://api-dog-server.herokuapp.com/"
+        self.url = server_url(url)
+        self.session = self.make_session()
+
+    def make_session(self):
+        # One keep-alive session and connection pool for every request, so polls reuse the pooled connection instead of a
+        # new TCP+TLS handshake. A start, a move or a poll whose response was lost may already have taken effect (the
+        # real server pops the move it answers with), so requests are only retried when they never reached the server
+        session = requests.Session()
+        retry = Retry(total=RETRIES, connect=RETRIES, read=0, status=0, backoff_factor=BACKOFF_FACTOR,
+                      allowed_methods=frozenset(["POST"]))
+        session.mount(self.url, HTTPAdapter(max_retries=retry))
+        return session
+
+    def post(self, path, post_data):
+        return self.session.post(self.url + path, data=post_data, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+
+    def close(self):
+        self.session.close()
 
     def get_status(self):
         return self.status
@@ -33,7 +68,11 @@ class DogProxy:
             self.status = 0
             return "Arquivo de configuração do jogo não encontrado"
         config_file.close()
-        resp = self.register_player(self.player_name, self.player_id, self.game_id)
+        try:
+            resp = self.register_player(self.player_name, self.player_id, self.game_id)
+        except requests.RequestException:
+            self.status = 1
+            return "Você está sem conexão"
         result = resp.status_code
         if result == 200:
             resp_json = resp.text
@@ -55,15 +94,16 @@ class DogProxy:
         return an_id
 
     def register_player(self, a_player_name, a_player_id, a_game_id):
-        url = self.url + "player/"
         post_data = {"player_name": a_player_name, "player_id": a_player_id, "game_id": a_game_id}
-        resp = requests.post(url, data=post_data)
+        resp = self.post("player/", post_data)
         return resp
 
     def start_match(self, number_of_players):
-        url = self.url + "start/"
         post_data = {"player_id": self.player_id, "game_id": self.game_id, "number_of_players": number_of_players}
-        resp = requests.post(url, data=post_data)
+        try:
+            resp = self.post("start/", post_data)
+        except requests.RequestException:
+            return StartStatus("0", "Voce está offline", [], self.player_id)
         result = resp.status_code
         if result == 200:
             resp_json = resp.text
@@ -80,9 +120,11 @@ class DogProxy:
         return start_status
 
     def start_status(self):
-        url = self.url + "started/"
         post_data = {"player_id": self.player_id, "game_id": self.game_id}
-        resp = requests.post(url, data=post_data)
+        try:
+            resp = self.post("started/", post_data)
+        except requests.RequestException:
+            return  #   the polling thread asks again on its next round
         result = resp.status_code
         if result == 200 and self.status == 2:
             resp_json = resp.text
@@ -97,10 +139,11 @@ class DogProxy:
                 self.dog_actor.receive_start(start_status)
 
     def send_move(self, a_move):
-        url = self.url + "move/"
         json_move = json.dumps(a_move)  # convert move to json
         post_data = {"player_id": self.player_id, "game_id": self.game_id, "move": json_move}
-        resp = requests.post(url, data=post_data)
+        # Failures reach the caller, which still holds the move and can send it again
+        resp = self.post("move/", post_data)
+        resp.raise_for_status()
         if a_move["match_status"] == "next":
             self.status = 3  #   pass the turn and start looking for a move
         elif a_move["match_status"] == "finished":
@@ -108,9 +151,13 @@ class DogProxy:
         return resp.text
 
     def match_status(self):
-        url = self.url + "match/"
-        post_data = {"player_id": self.player_id, "game_id": self.game_id}
-        resp = requests.post(url, data=post_data)
+        # move_order acknowledges every move handled so far. The local dog_server.py then keeps later moves queued until
+        # they are acknowledged, so a repeated poll gets the same move again; the real server pops each move it answers with
+        post_data = {"player_id": self.player_id, "game_id": self.game_id, "move_order": self.move_order}
+        try:
+            resp = self.post("match/", post_data)
+        except requests.RequestException:
+            return  #   the polling thread asks again on its next round
         resp_json = resp.text
         seek_result = json.loads(resp_json)
         if bool(seek_result):
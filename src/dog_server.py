@@ -0,0 +1,195 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from collections import deque
+from itertools import islice
+from random import Random
+import json
+
+from aiohttp import web
+
+# Local stand-in for the DOG server: same endpoints and response shapes DogProxy expects, everything kept in memory
+
+class Match():
+    def __init__(self, players: list[list[str]]) -> Match:
+        # players holds [name, id, order] per player
+        self._players: list[list[str]] = players
+        self._queues: dict[str, deque] = {player[1]: deque() for player in players}
+        self._order: int = 0
+        self._unannounced: set[str] = {player[1] for player in players}
+
+    @property
+    def players(self) -> list[list[str]]:
+        return self._players
+
+    def players_for(self, player_id: str) -> list[list[str]]:
+        # Each player sees itself first, as DogProxy expects
+        return [player for player in self._players if player[1] == player_id] + [player for player in self._players if player[1] != player_id]
+
+    def announce(self, player_id: str) -> bool:
+        # True only the first time: started/ reports a match once per player
+        if player_id in self._unannounced:
+            self._unannounced.remove(player_id)
+            return True
+        return False
+
+    def add_move(self, player_id: str, move: dict) -> int:
+        self._order += 1
+        move["player"] = player_id
+        move["order"] = self._order
+        for id, queue in self._queues.items():
+            if id != player_id:
+                queue.append(move)
+        return self._order
+
+    def next_move(self, player_id: str, acknowledged: int = None) -> dict:
+        # Clients that send their move_order keep moves queued until they acknowledge them, so a poll whose response was
+        # lost can be repeated; the others get each move once, as from the real server
+        queue = self._queues[player_id]
+        if acknowledged is None:
+            return queue.popleft() if queue else None
+        self.acknowledge(player_id, acknowledged)
+        return queue[0] if queue else None
+
+    def acknowledge(self, player_id: str, order: int = None):
+        # None acknowledges every move: the player has moved on from this match
+        queue = self._queues[player_id]
+        while queue and (order is None or queue[0]["order"] <= order):
+            queue.popleft()
+
+    def pending(self) -> bool:
+        return any(self._queues.values())
+
+class Game():
+    def __init__(self) -> Game:
+        self._names: dict[str, str] = {}
+        # Registered players not in a match, in arrival order (dict keeps insertion order)
+        self._waiting: dict[str, None] = {}
+        self._matches: dict[str, Match] = {}
+
+    def register(self, player_id: str, name: str):
+        self._names[player_id] = name
+        if player_id not in self._matches:
+            self._waiting[player_id] = None
+
+    def __free(self, player_id: str) -> bool:
+        # Waiting, and done reading the moves of its previous match
+        match = self._matches.get(player_id)
+        return player_id in self._waiting and (match is None or not match.pending())
+
+    def start(self, player_id: str, number_of_players: int, random: Random) -> tuple[str, str, Match]:
+        if player_id not in self._names:
+            return ("0", "Jogador não registrado", None)
+        if player_id not in self._waiting:
+            return ("1", "Jogador já está em uma partida", None)
+        others = list(islice((id for id in self._waiting if id != player_id and self.__free(id)), number_of_players - 1))
+        if len(others) < number_of_players - 1:
+            return ("1", "Jogadores insuficientes", None)
+
+        ids = [player_id] + others
+        orders = list(range(1, number_of_players + 1))
+        random.shuffle(orders)
+        match = Match([[self._names[id], id, str(order)] for id, order in zip(ids, orders)])
+        for id in ids:
+            del self._waiting[id]
+            self._matches[id] = match
+        match.announce(player_id)
+        return ("2", "Partida iniciada", match)
+
+    def match(self, player_id: str) -> Match:
+        return self._matches.get(player_id)
+
+    def leave(self, player_id: str):
+        # A waiting player asking to start or polling started/ has handled the end of its previous match
+        match = self._matches.get(player_id)
+        if match is not None and player_id in self._waiting:
+            match.acknowledge(player_id)
+            match.announce(player_id)
+
+    def finish(self, match: Match):
+        # Players wait for a new match again; the old one stays reachable until each of them has read its last move
+        for player in match.players:
+            self._waiting[player[1]] = None
+
+class DogServer():
+    def __init__(self, seed: int = None) -> DogServer:
+        self._games: dict[str, Game] = {}
+        self._random: Random = Random(seed)
+        self._requests: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    def application(self) -> web.Application:
+        app = web.Application()
+        app.add_routes([
+            web.post("/player/", self.player),
+            web.post("/start/", self.start),
+            web.post("/started/", self.started),
+            web.post("/move/", self.move),
+            web.post("/match/", self.match),
+        ])
+        return app
+
+    async def __form(self, request: web.Request) -> tuple:
+        self._requests += 1
+        form = await request.post()
+        return (form, self._games.setdefault(form.get("game_id", ""), Game()))
+
+    async def player(self, request: web.Request) -> web.Response:
+        form, game = await self.__form(request)
+        game.register(form["player_id"], form["player_name"])
+        return web.json_response({"0": "0", "1": "Jogador registrado"})
+
+    async def start(self, request: web.Request) -> web.Response:
+        form, game = await self.__form(request)
+        player_id = form["player_id"]
+        game.leave(player_id)
+        code, message, match = game.start(player_id, int(form["number_of_players"]), self._random)
+        players = match.players_for(player_id) if match is not None else []
+        return web.json_response({"code": code, "message": message, "players": players})
+
+    async def started(self, request: web.Request) -> web.Response:
+        form, game = await self.__form(request)
+        player_id = form["player_id"]
+        game.leave(player_id)
+        match = game.match(player_id)
+        if match is not None and match.announce(player_id):
+            return web.json_response({"code": "2", "message": "Partida iniciada", "players": match.players_for(player_id)})
+        return web.json_response({"code": "0", "message": "Aguardando partida", "players": []})
+
+    async def move(self, request: web.Request) -> web.Response:
+        form, game = await self.__form(request)
+        player_id = form["player_id"]
+        match = game.match(player_id)
+        if match is None:
+            return web.json_response({"0": "1", "1": "Jogador sem partida"})
+        move = json.loads(form["move"])
+        order = match.add_move(player_id, move)
+        if move.get("match_status") == "finished":
+            game.finish(match)
+        return web.json_response({"0": "0", "1": str(order)})
+
+    async def match(self, request: web.Request) -> web.Response:
+        # Oldest move after the player's move_order (if sent), as the repr DogProxy evaluates; {} when there is none
+        form, game = await self.__form(request)
+        player_id = form["player_id"]
+        match = game.match(player_id)
+        acknowledged = int(form["move_order"]) if "move_order" in form else None
+        move = match.next_move(player_id, acknowledged) if match is not None else None
+        if move is None:
+            return web.json_response({})
+        return web.json_response({"0": "0", "1": repr(move)})
+
+def main(argv: list[str] = None):
+    parser = ArgumentParser(description="Servidor DOG local, em memória, para testes e medições")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8080)
+    parser.add_argument("-s", "--seed", type=int, help="semente da ordem dos jogadores")
+    args = parser.parse_args(argv)
+
+    print("DOG local em http://%s:%d/ (use DOG_SERVER_URL para apontar os clientes)" % (args.host, args.port))
+    web.run_app(DogServer(args.seed).application(), host=args.host, port=args.port, print=None, access_log=None)
+
+if __name__ == "__main__":
+    main()
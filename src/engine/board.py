@@ -0,0 +1,706 @@
+from __future__ import annotations
+from enum import Enum
+from random import Random
+
+from engine.player import Player
+from engine.deck import Deck
+from engine.card import Card, Suit, CARDS
+from engine.board_place import BoardPlace
+from engine.board_geometry import BoardGeometry, GEOMETRY, geometry_for, mask_cells
+from engine.zobrist import ZobristKeys, zobrist_keys
+
+class BitBoard():
+    def __init__(self, jokers: int, owners: int = 2, geometry: BoardGeometry = GEOMETRY) -> BitBoard:
+        self._geometry: BoardGeometry = geometry
+        self._jokers: int = jokers
+        self._chips: list[int] = [0] * owners
+        self._in_sequence: int = 0
+        self._keys: ZobristKeys = zobrist_keys(geometry.cells, owners)
+        self._hash: int = 0
+
+        # Per window: jokers in it, chips of any owner in it and, per owner, owned-or-joker cells in it
+        self._window_jokers: list[int] = [(mask & jokers).bit_count() for mask in geometry.window_masks]
+        self._window_chips: list[int] = [0] * len(self._window_jokers)
+        self._counts: list[list[int]] = [list(self._window_jokers) for o in range(owners)]
+
+        # Per owner, how many windows free of opponent chips hold 0..sequence_length of its cells
+        self._open_windows: list[list[int]] = [[0] * (geometry.sequence_length + 1) for o in range(owners)]
+        for open_windows in self._open_windows:
+            for count in self._window_jokers:
+                open_windows[count] += 1
+
+        # Per owner and cell, how many open windows through the cell already hold sequence_length - 2 or more of its cells
+        self._threat_count: int = geometry.sequence_length - 2
+        self._threats: list[list[int]] = [[0] * geometry.cells for o in range(owners)]
+        for window, count in enumerate(self._window_jokers):
+            if count >= self._threat_count:
+                for threats in self._threats:
+                    for index in geometry.window_cells[window]:
+                        threats[index] += 1
+
+    @property
+    def jokers(self) -> int:
+        return self._jokers
+
+    @property
+    def in_sequence(self) -> int:
+        return self._in_sequence
+
+    @property
+    def hash(self) -> int:
+        # Zobrist hash of chip owners and in_sequence flags, updated on every change
+        return self._hash
+
+    @property
+    def keys(self) -> ZobristKeys:
+        return self._keys
+
+    def chips(self, owner: int) -> int:
+        return self._chips[owner]
+
+    def occupied(self) -> int:
+        occupied = self._jokers
+        for mask in self._chips:
+            occupied |= mask
+        return occupied
+
+    def opponent_chips(self, owner: int) -> int:
+        chips = 0
+        for other, mask in enumerate(self._chips):
+            if other != owner:
+                chips |= mask
+        return chips
+
+    def counts(self, owner: int) -> list[int]:
+        return self._counts[owner]
+
+    def open_windows(self, owner: int) -> list[int]:
+        return self._open_windows[owner]
+
+    def threats(self, owner: int) -> list[int]:
+        return self._threats[owner]
+
+    def is_open(self, window: int, owner: int) -> bool:
+        return self._window_chips[window] == self._counts[owner][window] - self._window_jokers[window]
+
+    def chips_to_sequence(self, owner: int) -> int:
+        # Fewest chips the owner still needs in a window no opponent has blocked
+        length = self._geometry.sequence_length
+        open_windows = self._open_windows[owner]
+        for count in range(length - 1, -1, -1):
+            if open_windows[count]:
+                return length - count
+        return length + 1
+
+    def put_chip(self, index: int, owner: int):
+        self._chips[owner] |= 1 << index
+        self._hash ^= self._keys.chip(owner, index)
+        counts = self._counts[owner]
+        for window in self._geometry.windows(index):
+            self.__update_open_windows(window, -1)
+            counts[window] += 1
+            self._window_chips[window] += 1
+            self.__update_open_windows(window, 1)
+
+    def take_chip(self, index: int, owner: int):
+        self._chips[owner] &= ~(1 << index)
+        self._hash ^= self._keys.chip(owner, index)
+        counts = self._counts[owner]
+        for window in self._geometry.windows(index):
+            self.__update_open_windows(window, -1)
+            counts[window] -= 1
+            self._window_chips[window] -= 1
+            self.__update_open_windows(window, 1)
+
+    def __update_open_windows(self, window: int, delta: int):
+        chips = self._window_chips[window]
+        jokers = self._window_jokers[window]
+        for owner, counts in enumerate(self._counts):
+            if chips == counts[window] - jokers:
+                self._open_windows[owner][counts[window]] += delta
+                if counts[window] >= self._threat_count:
+                    threats = self._threats[owner]
+                    for index in self._geometry.window_cells[window]:
+                        threats[index] += delta
+
+    def new_sequences(self, index: int, owner: int) -> list[int]:
+        # A new sequence may share at most one chip with the owner's previous sequences
+        length = self._geometry.sequence_length
+        counts = self._counts[owner]
+        marked = self._in_sequence & self._chips[owner]
+        window_masks = self._geometry.window_masks
+        sequences = []
+        for window in self._geometry.windows(index):
+            if counts[window] == length:
+                mask = window_masks[window]
+                if (marked & mask).bit_count() <= 1:
+                    sequences.append(window)
+                    marked |= mask & self._chips[owner]
+        return sequences
+
+    def mark_sequence(self, window: int):
+        self.mark_cells(self._geometry.window_masks[window])
+
+    def mark_cells(self, mask: int):
+        marked = mask & ~self._jokers & ~self._in_sequence
+        self._in_sequence |= marked
+        for index in mask_cells(marked):
+            self._hash ^= self._keys.in_sequence(index)
+
+    def unmark_sequence(self, mask: int):
+        unmarked = mask & self._in_sequence
+        self._in_sequence &= ~unmarked
+        for index in mask_cells(unmarked):
+            self._hash ^= self._keys.in_sequence(index)
+
+    def clone(self) -> BitBoard:
+        bitboard = BitBoard.__new__(BitBoard)
+        bitboard._geometry = self._geometry
+        bitboard._jokers = self._jokers
+        bitboard._chips = list(self._chips)
+        bitboard._in_sequence = self._in_sequence
+        bitboard._keys = self._keys
+        bitboard._hash = self._hash
+        bitboard._window_jokers = self._window_jokers
+        bitboard._window_chips = list(self._window_chips)
+        bitboard._counts = [list(counts) for counts in self._counts]
+        bitboard._open_windows = [list(open_windows) for open_windows in self._open_windows]
+        bitboard._threat_count = self._threat_count
+        bitboard._threats = [list(threats) for threats in self._threats]
+        return bitboard
+
+SEQUENCES_TO_WIN = 5
+# Official targets for the 3-player and team variants, by number of teams; two players keep SEQUENCES_TO_WIN
+TEAM_SEQUENCES_TO_WIN = {2: 2, 3: 1}
+HINT_LIMIT = 3
+
+# Official hand sizes by number of players, and chip colours by team
+HAND_SIZES = {2: 7, 3: 6, 4: 6, 6: 5, 8: 4, 9: 4, 10: 3, 12: 3}
+CHIP_COLORS = ("red", "blue", "green")
+
+def default_sequences_to_win(players: int, teams: int) -> int:
+    return SEQUENCES_TO_WIN if players == 2 else TEAM_SEQUENCES_TO_WIN[teams]
+
+def chip_color(seat: int, local_seat: int, teams: int) -> str:
+    # Colours are rotated so the local team always plays red
+    return CHIP_COLORS[(seat - local_seat) % teams]
+
+# Cell codes of Board.chip_grid: owners are stored as owner + 1
+EMPTY_CELL = 0
+JOKER_CELL = -1
+
+class Status(Enum):
+    STARTING = "starting"
+    YOUR_TURN_CARD = "your_turn_card"
+    YOUR_TURN_BOARD = "your_turn_board"
+    OPPONENT_TURN = "opponent_turn"
+    FINISHED = "finished"
+    WITHDRAW = "withdraw"
+
+class Board():
+    def __init__(self, size: int = GEOMETRY.size) -> Board:
+        self._deck: Deck = None
+        self._local_player: Player = Player("Local", CHIP_COLORS[0])
+        # Players in turn order; the seat of a player decides its team, teams alternate around the table
+        self._players: list[Player] = [self._local_player, Player("Remote", CHIP_COLORS[1])]
+        self._seats: dict[Player, int] = {player: seat for seat, player in enumerate(self._players)}
+        self._teams: int = 2
+        self._sequences_to_win: int = SEQUENCES_TO_WIN
+        self._turn_player: Player = None
+        self._board_places: list[BoardPlace] = []
+        self._geometry: BoardGeometry = geometry_for(size)
+        self._bitboard: BitBoard = None
+        self._card_positions: list[tuple[int, ...]] = []
+        self._empty_positions: list[int] = []
+        self._empty_places: int = 0
+        self._match_status: Status = Status.STARTING
+        self._history: list[tuple] = []
+
+    def __make_board_places(self) -> list[BoardPlace]:
+        deck = self._deck.make_board_deck(self._geometry.size)
+        return [BoardPlace(card) for card in deck]
+
+    def __make_bitboard(self) -> BitBoard:
+        jokers = 0
+        for index, place in enumerate(self._board_places):
+            if place.card.suit == Suit.JOKER:
+                jokers |= 1 << index
+        return BitBoard(jokers, self._teams, self._geometry)
+
+    def __index_positions(self):
+        # Per card id: where the card is on the board and how many of those places are still empty
+        positions = [[] for card in CARDS]
+        for index, place in enumerate(self._board_places):
+            positions[place.card.id].append(index)
+        self._card_positions = [tuple(p) for p in positions]
+        self._empty_positions = [len(p) for p in positions]
+        self._empty_places = len(self._board_places) - self._bitboard.jokers.bit_count()
+
+    def owner(self, player: Player) -> int:
+        # Chips belong to teams: the owner index is the player's team
+        return self._seats[player] % self._teams
+
+    def __put_chip(self, index: int, player: Player):
+        place = self._board_places[index]
+        place.put_chip(player)
+        self._bitboard.put_chip(index, self.owner(player))
+        self._empty_positions[place.card.id] -= 1
+        self._empty_places -= 1
+
+    def __take_chip(self, index: int):
+        place = self._board_places[index]
+        self._bitboard.take_chip(index, self.owner(place.player_in_place))
+        place.take_chip()
+        self._empty_positions[place.card.id] += 1
+        self._empty_places += 1
+
+    def __next_player(self, player: Player) -> Player:
+        return self._players[(self._seats[player] + 1) % len(self._players)]
+
+    def __add_sequences(self, owner: int, n: int):
+        for player in self.team(owner):
+            player.add_sequences(n)
+
+    def __set_winner(self, owner: int, value: bool):
+        for player in self.team(owner):
+            player.set_winner(value)
+
+    def __turn_status(self, player: Player) -> Status:
+        return Status.YOUR_TURN_CARD if player is self._local_player else Status.OPPONENT_TURN
+
+    def __unmark_sequence(self, mask: int):
+        self._bitboard.unmark_sequence(mask)
+        for i in mask_cells(mask):
+            self._board_places[i].in_sequence = False
+
+    def __mark_sequence(self, window: int):
+        self._bitboard.mark_sequence(window)
+        for i in self._geometry.window_cells[window]:
+            if self._board_places[i].card.suit != Suit.JOKER:
+                self._board_places[i].in_sequence = True
+
+    @property
+    def deck(self) -> Deck:
+        return self._deck
+
+    @property
+    def board_places(self) -> list[BoardPlace]:
+        return self._board_places
+
+    @property
+    def bitboard(self) -> BitBoard:
+        return self._bitboard
+
+    @property
+    def geometry(self) -> BoardGeometry:
+        return self._geometry
+
+    @property
+    def local_player(self) -> Player:
+        return self._local_player
+
+    @property
+    def sequences_to_win(self) -> int:
+        return self._sequences_to_win
+
+    @property
+    def players(self) -> list[Player]:
+        # In turn order
+        return self._players
+
+    @property
+    def owners(self) -> int:
+        return self._teams
+
+    def team(self, owner: int) -> list[Player]:
+        return self._players[owner::self._teams]
+
+    def sequences(self, owner: int) -> int:
+        # Team members share their sequences, so any of them holds the count
+        return self._players[owner].sequences
+
+    @property
+    def turn_player(self) -> Player:
+        return self._turn_player
+
+    @property
+    def match_status(self) -> Status:
+        return self._match_status
+
+    @match_status.setter
+    def match_status(self, value: Status):
+        self._match_status = value
+
+    @turn_player.setter
+    def turn_player(self, value: Player):
+        self._turn_player = value
+
+    def card_positions(self, card: Card) -> tuple[int, ...]:
+        return self._card_positions[card.id]
+
+    def empty_positions(self, card: Card) -> int:
+        return self._empty_positions[card.id]
+
+    def window_counts(self, player: Player) -> list[int]:
+        return self._bitboard.counts(self.owner(player))
+
+    def chips_to_sequence(self, player: Player) -> int:
+        return self._bitboard.chips_to_sequence(self.owner(player))
+
+    def threats(self, player: Player) -> list[int]:
+        return self._bitboard.threats(self.owner(player))
+
+    def hint_places(self, card: Card, limit: int = HINT_LIMIT) -> list[int]:
+        # Best board places for the turn player's card: cells that advance its near-complete windows or block the opponent's
+        owner = self.owner(self._turn_player)
+        occupied = self._bitboard.occupied()
+        if card.is_one_eye_jack():
+            places = mask_cells(self._bitboard.opponent_chips(owner) & ~self._bitboard.in_sequence)
+        elif card.is_two_eyes_jack():
+            places = mask_cells(~occupied & ((1 << len(self._board_places)) - 1))
+        else:
+            places = [i for i in self._card_positions[card.id] if not occupied >> i & 1]
+
+        scores = [0] * len(self._board_places)
+        for other in range(self._teams):
+            if other != owner or not card.is_one_eye_jack():
+                threats = self._bitboard.threats(other)
+                for i in places:
+                    scores[i] += threats[i]
+        places = [i for i in places if scores[i] > 0]
+        places.sort(key=lambda i: scores[i], reverse=True)
+        return places[:limit]
+
+    def chip_grid(self) -> list[int]:
+        # One code per cell, row by row: EMPTY_CELL, JOKER_CELL or owner + 1
+        grid = [EMPTY_CELL] * self._geometry.cells
+        for index in mask_cells(self._bitboard.jokers):
+            grid[index] = JOKER_CELL
+        for owner in range(self._teams):
+            for index in mask_cells(self._bitboard.chips(owner)):
+                grid[index] = owner + 1
+        return grid
+
+    def start_match(self, players: list, local_player_id: str, seed: int = None, teams: int = None, sequences_to_win: int = None) -> str:
+        # players holds [name, id, order] per player; with more than three players they play in teams.
+        # Every client must agree on the target, so it defaults to one derived from the players and teams alone
+        if len(players) not in HAND_SIZES:
+            raise ValueError(f"Número de jogadores inválido: {len(players)}")
+        if teams is None:
+            teams = len(players) if len(players) <= 3 else (2 if len(players) % 2 == 0 else 3)
+        if teams not in (2, 3) or len(players) % teams:
+            raise ValueError(f"Não é possível dividir {len(players)} jogadores em {teams} equipes")
+
+        info = ""
+        ordered = sorted(players, key=lambda player: int(player[2]))
+        local_seat = [player[1] for player in ordered].index(local_player_id)
+        self._teams = teams
+        self._sequences_to_win = sequences_to_win if sequences_to_win is not None else default_sequences_to_win(len(players), teams)
+        self._players = []
+        for seat, (name, id, order) in enumerate(ordered):
+            player = Player(name, chip_color(seat, local_seat, teams))
+            player.initialize(id, name)
+            self._players.append(player)
+        self._seats = {player: seat for seat, player in enumerate(self._players)}
+        self._local_player = self._players[local_seat]
+
+        # Every client derives the same generator from the player ids, so they deal the same deck
+        if seed is None:
+            seed = sum(int(player[1]) for player in players)
+        self._deck = Deck(Random(seed))
+        self._board_places = self.__make_board_places()
+        self._bitboard = self.__make_bitboard()
+        self.__index_positions()
+        self._history = []
+
+        self._turn_player = self._players[0]
+        self._match_status = self.__turn_status(self._turn_player)
+        info = "Sua vez" if self._turn_player is self._local_player else "Vez do\noponente"
+        for i in range(HAND_SIZES[len(players)]):
+            for player in self._players:
+                player.draw(self._deck.draw())
+        return info
+
+    def reset_game(self):
+        for player in self._players:
+            player.reset()
+        self._deck = None
+        self._board_places = []
+        self._bitboard = None
+        self._card_positions = []
+        self._empty_positions = []
+        self._empty_places = 0
+        self._match_status = Status.STARTING
+        self._history = []
+
+    def __is_dead_card(self, card: Card) -> bool:
+        # Same rules as __verify_card, answered from the position index and the bitboard
+        if card.is_two_eyes_jack():
+            return self._empty_places == 0
+        if card.is_one_eye_jack():
+            owner = self.owner(self._turn_player)
+            return self._bitboard.opponent_chips(owner) & ~self._bitboard.in_sequence == 0
+        return self._empty_positions[card.id] == 0
+
+    def legal_moves(self) -> list[tuple[int, int]]:
+        # (hand index, board index) pairs the turn player may play, without changing the match
+        owner = self.owner(self._turn_player)
+        occupied = self._bitboard.occupied()
+        free = None
+        removable = None
+        moves = []
+        for hand_index, card in enumerate(self._turn_player.hand):
+            if card.is_two_eyes_jack():
+                if free is None:
+                    free = mask_cells(~occupied & ((1 << len(self._board_places)) - 1))
+                moves.extend((hand_index, i) for i in free)
+            elif card.is_one_eye_jack():
+                if removable is None:
+                    removable = mask_cells(self._bitboard.opponent_chips(owner) & ~self._bitboard.in_sequence)
+                moves.extend((hand_index, i) for i in removable)
+            else:
+                moves.extend((hand_index, i) for i in self._card_positions[card.id] if not occupied >> i & 1)
+        return moves
+
+    def dead_cards(self) -> list[int]:
+        return [hand_index for hand_index, card in enumerate(self._turn_player.hand) if self.__is_dead_card(card)]
+
+    def receive_withdrawal_notification(self):
+        self._match_status = Status.WITHDRAW
+
+    def pick_card(self, index: int) -> (dict, str):
+        move_to_send = {}
+        info = ""
+        move_to_send["hand_index"] = index
+        move_to_send["match_status"] = "progress"
+
+        card = self._turn_player.play(index)
+        self._deck.discard(card)
+
+        if not self.__is_dead_card(card):
+            info = "Aguardando\njogada no\ntabuleiro"
+            if self._turn_player is self._local_player:
+                self._match_status = Status.YOUR_TURN_BOARD
+        else:
+            info = "Carta\nmorta"
+            new_card = self._deck.draw()
+            self._turn_player.draw(new_card)
+
+        return (move_to_send, info)
+
+    def __verify_card(self, card: Card, place: BoardPlace) -> bool:
+        is_valid = False
+        if place.empty():
+            if card == place.card:
+                is_valid = True
+            elif card.is_two_eyes_jack():
+                is_valid = place.card.suit != Suit.JOKER
+            else:
+                is_valid = False
+        elif card.is_one_eye_jack():
+            # Only chips of another team can be removed
+            if self.owner(self._turn_player) != self.owner(place.player_in_place):
+                is_valid = not place.in_sequence
+            else:
+                is_valid = False
+        return is_valid
+
+    def select_board_place(self, index) -> (dict, str):
+        move_to_send = {}
+        info = ""
+        card = self._deck.discard_pile_top()
+        place = self._board_places[index]
+
+        valid = self.__verify_card(card, place)
+        if valid:
+            info = "Turno do\noponente"
+            move_to_send["board_index"] = index
+            move_to_send["match_status"] = "next"
+            player = self._turn_player
+
+            finished = False
+            if card.is_one_eye_jack():
+                self.__take_chip(index)
+            else:
+                self.__put_chip(index, player)
+                finished = self.evaluate_match_finish(index)
+            new_card = self._deck.draw()
+            player.draw(new_card)
+
+            if finished:
+                info = "Vitória\n de " + player.name
+                self.__set_winner(self.owner(player), True)
+                move_to_send["match_status"] = "finished"
+                self._match_status = Status.FINISHED
+            else:
+                self._turn_player = self.__next_player(player)
+                self._match_status = self.__turn_status(self._turn_player)
+        else:
+            info = "Local\ninválido"
+        return (move_to_send, info)
+
+    def receive_move(self, move: dict) -> str:
+        info = ""
+        if move["match_status"] == "progress":
+            print("jogada da mão")
+            hand_index = move["hand_index"]
+            self.pick_card(hand_index)
+            info = "Turno do\noponente"
+        else:
+            print("jogada no board")
+            board_index = move["board_index"]
+            self.select_board_place(board_index)
+
+            if self._match_status == Status.YOUR_TURN_CARD:
+                info = "Sua vez"
+            elif self._match_status != Status.FINISHED:
+                info = "Vez do\noponente"
+            else:
+                info = "Vitória\n de " + self._turn_player.name
+        return info
+
+    def evaluate_match_finish(self, index: int) -> bool:
+        self.__complete_sequences(index)
+
+        print(self._turn_player.name + " tem " + str(self._turn_player.sequences) + " sequencias")
+        finished = self._turn_player.sequences >= self._sequences_to_win
+
+        return finished
+
+    def __complete_sequences(self, index: int) -> int:
+        owner = self.owner(self._turn_player)
+        sequences = self._bitboard.new_sequences(index, owner)
+        for window in sequences:
+            self.__mark_sequence(window)
+        self.__add_sequences(owner, len(sequences))
+        return len(sequences)
+
+    def apply_move(self, move: tuple[int, int]):
+        # A whole turn: play the hand card, place or remove a chip and draw. A board index of None discards a dead card
+        hand_index, board_index = move
+        player = self._turn_player
+        status = self._match_status
+        card = player.play(hand_index)
+        self._deck.discard(card)
+
+        removed = None
+        marked = 0
+        sequences = 0
+        if board_index is not None:
+            if card.is_one_eye_jack():
+                removed = self._board_places[board_index].player_in_place
+                self.__take_chip(board_index)
+            else:
+                self.__put_chip(board_index, player)
+                in_sequence = self._bitboard.in_sequence
+                sequences = self.__complete_sequences(board_index)
+                marked = self._bitboard.in_sequence & ~in_sequence
+
+        deck_state = self._deck.snapshot() if self._deck.deck_is_empty() else None
+        player.draw(self._deck.draw())
+        self._history.append((move, card, removed, marked, sequences, deck_state, player, status))
+
+        if board_index is None:
+            self._match_status = self.__turn_status(player)
+        elif player.sequences >= self._sequences_to_win:
+            self.__set_winner(self.owner(player), True)
+            self._match_status = Status.FINISHED
+        else:
+            self._turn_player = self.__next_player(player)
+            self._match_status = self.__turn_status(self._turn_player)
+
+    def undo_move(self):
+        move, card, removed, marked, sequences, deck_state, player, status = self._history.pop()
+        hand_index, board_index = move
+
+        drawn = player.undraw()
+        if deck_state is None:
+            self._deck.undraw(drawn)
+        else:
+            self._deck.restore(deck_state)
+
+        if board_index is not None:
+            if card.is_one_eye_jack():
+                self.__put_chip(board_index, removed)
+            else:
+                self.__unmark_sequence(marked)
+                self.__add_sequences(self.owner(player), -sequences)
+                self.__take_chip(board_index)
+
+        self._deck.undiscard()
+        player.unplay(hand_index, card)
+        self.__set_winner(self.owner(player), False)
+        self._turn_player = player
+        self._match_status = status
+
+    @property
+    def zobrist_hash(self) -> int:
+        return self._bitboard.hash ^ self._bitboard.keys.turn(self.owner(self._turn_player))
+
+    def position_key(self) -> tuple:
+        # Identifies a position reached through different move orders: board hash with side to move, hands and the draw pile,
+        # whose order decides every later draw
+        return (
+            self.zobrist_hash,
+            tuple(tuple(sorted(card.id for card in player.hand)) for player in self.players),
+            tuple(self.sequences(owner) for owner in range(self._teams)),
+            tuple(card.id for card in self._deck.cards),
+        )
+
+    def determinize(self, viewer: Player, random: Random):
+        # Re-deal every card viewer cannot see (other hands and the draw pile), keeping their sizes
+        others = [player for player in self.players if player is not viewer]
+        hidden = list(self._deck.cards)
+        for player in others:
+            hidden.extend(player.hand)
+        random.shuffle(hidden)
+        for player in others:
+            size = len(player.hand)
+            player.replace_hand(hidden[:size])
+            hidden = hidden[size:]
+        self._deck.replace_cards(hidden, Random(random.getrandbits(64)))
+
+    def restore(self, players: list[Player], local_seat: int, teams: int, sequences_to_win: int, board_cards: list[Card],
+                deck: Deck, owners: list[int], in_sequence: int, turn_seat: int, status: Status):
+        # Rebuilds a match mid-game; owners holds the seat of the player on each cell, or None. The undo history starts empty
+        self._players = players
+        self._seats = {player: seat for seat, player in enumerate(players)}
+        self._local_player = players[local_seat]
+        self._teams = teams
+        self._sequences_to_win = sequences_to_win
+        self._deck = deck
+        self._board_places = [BoardPlace(card) for card in board_cards]
+        self._bitboard = self.__make_bitboard()
+        self.__index_positions()
+        for index, seat in enumerate(owners):
+            if seat is not None:
+                self.__put_chip(index, players[seat])
+        self._bitboard.mark_cells(in_sequence)
+        for index in mask_cells(self._bitboard.in_sequence):
+            self._board_places[index].in_sequence = True
+        self._turn_player = players[turn_seat]
+        self._match_status = status
+        self._history = []
+
+    def clone(self) -> Board:
+        # Cards are shared flyweights; everything mutable is copied. The undo history is not carried over
+        board = Board.__new__(Board)
+        players = {None: None}
+        for player in self._players:
+            players[player] = player.clone()
+        board._players = [players[player] for player in self._players]
+        board._seats = {players[player]: seat for player, seat in self._seats.items()}
+        board._local_player = players[self._local_player]
+        board._teams = self._teams
+        board._sequences_to_win = self._sequences_to_win
+        board._turn_player = players[self._turn_player]
+        board._deck = self._deck.clone() if self._deck is not None else None
+        board._board_places = [place.clone(players[place.player_in_place]) for place in self._board_places]
+        board._geometry = self._geometry
+        board._bitboard = self._bitboard.clone() if self._bitboard is not None else None
+        board._card_positions = self._card_positions
+        board._empty_positions = list(self._empty_positions)
+        board._empty_places = self._empty_places
+        board._match_status = self._match_status
+        board._history = []
+        return board
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+SEQUENCE_LENGTH = 5
+
+class BoardGeometry():
+    def __init__(self, size: int = 10, sequence_length: int = SEQUENCE_LENGTH) -> BoardGeometry:
+        self._size: int = size
+        self._sequence_length: int = sequence_length
+        cells = range(size * size)
+
+        self._positions: tuple[tuple[int, int], ...] = tuple(divmod(i, size) for i in cells)
+        self._rows: tuple[tuple[int, ...], ...] = tuple(self.__line(r, 0, 0, 1) for r in range(size))
+        self._columns: tuple[tuple[int, ...], ...] = tuple(self.__line(0, c, 1, 0) for c in range(size))
+
+        # Diagonal goes down to the right (row - col constant), anti-diagonal down to the left (row + col constant)
+        diagonals = {}
+        anti_diagonals = {}
+        for i in cells:
+            row, col = self._positions[i]
+            diagonals.setdefault(row - col, []).append(i)
+            anti_diagonals.setdefault(row + col, []).append(i)
+
+        self._cell_row: tuple[tuple[int, ...], ...] = tuple(self._rows[self._positions[i][0]] for i in cells)
+        self._cell_column: tuple[tuple[int, ...], ...] = tuple(self._columns[self._positions[i][1]] for i in cells)
+        self._cell_diagonal: tuple[tuple[int, ...], ...] = tuple(tuple(diagonals[r - c]) for r, c in self._positions)
+        self._cell_anti_diagonal: tuple[tuple[int, ...], ...] = tuple(tuple(anti_diagonals[r + c]) for r, c in self._positions)
+        self._neighbours: tuple[tuple[int, ...], ...] = tuple(self.__neighbours(i) for i in cells)
+
+        windows = []
+        for line in self._rows + self._columns + tuple(diagonals.values()) + tuple(anti_diagonals.values()):
+            for start in range(len(line) - sequence_length + 1):
+                windows.append(tuple(line[start:start + sequence_length]))
+        self._window_cells: tuple[tuple[int, ...], ...] = tuple(windows)
+        self._window_masks: tuple[int, ...] = tuple(sum(1 << i for i in window) for window in windows)
+
+        cell_windows = [[] for i in cells]
+        for w, window in enumerate(windows):
+            for i in window:
+                cell_windows[i].append(w)
+        self._cell_windows: tuple[tuple[int, ...], ...] = tuple(tuple(w) for w in cell_windows)
+
+    def __reduce__(self):
+        return (geometry_for, (self._size, self._sequence_length))
+
+    def __line(self, row: int, col: int, d_row: int, d_col: int) -> tuple[int, ...]:
+        line = []
+        while 0 <= row < self._size and 0 <= col < self._size:
+            line.append(row * self._size + col)
+            row += d_row
+            col += d_col
+        return tuple(line)
+
+    def __neighbours(self, index: int) -> tuple[int, ...]:
+        row, col = self._positions[index]
+        neighbours = []
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                r = row + d_row
+                c = col + d_col
+                if (d_row or d_col) and 0 <= r < self._size and 0 <= c < self._size:
+                    neighbours.append(r * self._size + c)
+        return tuple(neighbours)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def cells(self) -> int:
+        return self._size * self._size
+
+    @property
+    def sequence_length(self) -> int:
+        return self._sequence_length
+
+    @property
+    def window_cells(self) -> tuple[tuple[int, ...], ...]:
+        return self._window_cells
+
+    @property
+    def window_masks(self) -> tuple[int, ...]:
+        return self._window_masks
+
+    @property
+    def cell_windows(self) -> tuple[tuple[int, ...], ...]:
+        return self._cell_windows
+
+    def position(self, index: int) -> tuple[int, int]:
+        return self._positions[index]
+
+    def index(self, row: int, col: int) -> int:
+        return row * self._size + col
+
+    def row(self, index: int) -> tuple[int, ...]:
+        return self._cell_row[index]
+
+    def column(self, index: int) -> tuple[int, ...]:
+        return self._cell_column[index]
+
+    def diagonal(self, index: int) -> tuple[int, ...]:
+        return self._cell_diagonal[index]
+
+    def anti_diagonal(self, index: int) -> tuple[int, ...]:
+        return self._cell_anti_diagonal[index]
+
+    def neighbours(self, index: int) -> tuple[int, ...]:
+        return self._neighbours[index]
+
+    def windows(self, index: int) -> tuple[int, ...]:
+        return self._cell_windows[index]
+
+def mask_cells(mask: int) -> list[int]:
+    cells = []
+    while mask:
+        low = mask & -mask
+        cells.append(low.bit_length() - 1)
+        mask ^= low
+    return cells
+
+_GEOMETRIES: dict[tuple[int, int], BoardGeometry] = {}
+
+def geometry_for(size: int = 10, sequence_length: int = SEQUENCE_LENGTH) -> BoardGeometry:
+    # Geometry tables are immutable, so boards of the same shape (and unpickled boards) share one instance
+    key = (size, sequence_length)
+    if key not in _GEOMETRIES:
+        _GEOMETRIES[key] = BoardGeometry(size, sequence_length)
+    return _GEOMETRIES[key]
+
+GEOMETRY = geometry_for()
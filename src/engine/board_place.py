@@ -1,8 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from player import Player
-from card import Card
+from engine.player import Player
+from engine.card import Card
 
 class BoardPlace():
     def __init__(self, card: Card):
@@ -34,3 +34,9 @@ class BoardPlace():
 
     def take_chip(self):
         self._player_in_place = None
+
+    def clone(self, player: Player) -> BoardPlace:
+        place = BoardPlace(self._card)
+        place._player_in_place = player
+        place._in_sequence = self._in_sequence
+        return place
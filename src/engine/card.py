@@ -0,0 +1,68 @@
+from __future__ import annotations
+from enum import Enum
+
+class Suit(Enum):
+    CLUBS = "clubs"
+    DIAMONDS = "diamonds"
+    HEARTS = "hearts"
+    SPADES = "spades"
+    JOKER = "joker"
+
+SUITS = (Suit.CLUBS, Suit.DIAMONDS, Suit.HEARTS, Suit.SPADES)
+
+class Card:
+    # Flyweight: one immutable instance per (number, suit), so cards compare by identity
+    __slots__ = ("_number", "_suit", "_id")
+
+    def __new__(cls, number: int, suit: Suit) -> Card:
+        try:
+            return _CARDS_BY_KEY[(number, suit)]
+        except KeyError:
+            raise ValueError("Carta inválida: " + str(number) + " de " + str(suit)) from None
+
+    @classmethod
+    def from_id(cls, id: int) -> Card:
+        return CARDS[id]
+
+    @property
+    def number(self) -> int:
+        return self._number
+
+    @property
+    def suit(self) -> Suit:
+        return self._suit
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    def is_two_eyes_jack(self) -> bool:
+        return TWO_EYES_JACK[self._id]
+
+    def is_one_eye_jack(self) -> bool:
+        return ONE_EYE_JACK[self._id]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card é imutável")
+
+    def __reduce__(self):
+        return (Card, (self._number, self._suit))
+
+    def __repr__(self) -> str:
+        return "Card(" + str(self._number) + ", " + str(self._suit) + ")"
+
+def _make_cards() -> tuple[Card, ...]:
+    keys = [(number, suit) for number in range(1, 14) for suit in SUITS] + [(0, Suit.JOKER)]
+    cards = []
+    for id, (number, suit) in enumerate(keys):
+        card = object.__new__(Card)
+        object.__setattr__(card, "_number", number)
+        object.__setattr__(card, "_suit", suit)
+        object.__setattr__(card, "_id", id)
+        cards.append(card)
+    return tuple(cards)
+
+CARDS: tuple[Card, ...] = _make_cards()
+_CARDS_BY_KEY: dict[tuple[int, Suit], Card] = {(card.number, card.suit): card for card in CARDS}
+TWO_EYES_JACK: tuple[bool, ...] = tuple(card.number == 11 and card.suit in (Suit.DIAMONDS, Suit.CLUBS) for card in CARDS)
+ONE_EYE_JACK: tuple[bool, ...] = tuple(card.number == 11 and card.suit in (Suit.HEARTS, Suit.SPADES) for card in CARDS)
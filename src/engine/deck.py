@@ -0,0 +1,107 @@
+from __future__ import annotations
+from random import Random
+
+from engine.card import Card, Suit
+
+class Deck:
+    def __init__(self, random: Random = None) -> Deck:
+        self._random: Random = random if random is not None else Random()
+        self._cards: list[Card] = self.__make_main_deck()
+        self._discard_pile: list[Card] = []
+        self._random.shuffle(self._cards)
+
+    def __make_test_deck(self) -> list[Card]:
+        return [Card(11, Suit.DIAMONDS) for i in range(20)]
+
+    def __make_main_deck(self) -> list[Card]:
+        cards = []
+
+        for i in range(2):
+            for number in range (1,14):
+                cards.append(Card(number, Suit.CLUBS))
+                cards.append(Card(number, Suit.DIAMONDS))
+                cards.append(Card(number, Suit.HEARTS))
+                cards.append(Card(number, Suit.SPADES))
+
+        return cards
+
+    def make_board_deck(self, size: int = 10) -> list[Card]:
+        # One place per cell: copies of the deck without jacks, two jokers per copy, as many copies as the board needs
+        cards = []
+
+        while len(cards) < size * size:
+            for number in range (1,14):
+                if number != 11:
+                    cards.append(Card(number, Suit.CLUBS))
+                    cards.append(Card(number, Suit.DIAMONDS))
+                    cards.append(Card(number, Suit.HEARTS))
+                    cards.append(Card(number, Suit.SPADES))
+
+            for i in range(2):
+                cards.append(Card(0, Suit.JOKER))
+
+        cards = cards[:size * size]
+        self._random.shuffle(cards)
+        return cards
+
+    def draw(self) -> Card:
+        if (self.deck_is_empty()):
+            self.reshuffle()
+        return self._cards.pop()
+
+    def discard(self, card: Card):
+        self._discard_pile.insert(0, card)
+
+    def reshuffle(self):
+        while len(self._discard_pile) > 0:
+            self._cards.append(self._discard_pile.pop())
+        self._random.shuffle(self._cards)
+
+    @property
+    def cards(self) -> list[Card]:
+        return self._cards
+
+    @property
+    def discard_pile(self) -> list[Card]:
+        return self._discard_pile
+
+    def replace_cards(self, cards: list[Card], random: Random):
+        self._cards = cards
+        self._random = random
+
+    def undraw(self, card: Card):
+        self._cards.append(card)
+
+    def undiscard(self) -> Card:
+        return self._discard_pile.pop(0)
+
+    def snapshot(self) -> tuple[list[Card], list[Card], tuple]:
+        return (list(self._cards), list(self._discard_pile), self._random.getstate())
+
+    def restore(self, snapshot: tuple[list[Card], list[Card], tuple]):
+        self._cards = list(snapshot[0])
+        self._discard_pile = list(snapshot[1])
+        self._random.setstate(snapshot[2])
+
+    @classmethod
+    def from_piles(cls, cards: list[Card], discard_pile: list[Card], random: Random) -> Deck:
+        deck = cls.__new__(cls)
+        deck._random = random
+        deck._cards = cards
+        deck._discard_pile = discard_pile
+        return deck
+
+    def clone(self) -> Deck:
+        deck = Deck.__new__(Deck)
+        deck._random = Random()
+        deck.restore(self.snapshot())
+        return deck
+
+    def discard_pile_top(self) -> Card:
+        return self._discard_pile[0] if len(self._discard_pile) else None
+
+    def deck_is_empty(self) -> bool:
+        return len(self._cards) == 0
+
+    def discard_is_empty(self) -> bool:
+        return len(self._discard_pile) == 0
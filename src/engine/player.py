@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from card import Card
+from engine.card import Card
 
 class Player():
     def __init__(self, name: str, chip_color: str) -> Player:
@@ -20,6 +20,7 @@ class Player():
         self._name = ""
         self._hand = []
         self._winner = False
+        self._sequences = 0
 
     @property
     def name(self) -> str:
@@ -45,6 +46,10 @@ class Player():
     def sequences(self) -> int:
         return self._sequences
 
+    @property
+    def winner(self) -> bool:
+        return self._winner
+
     def set_winner(self, value: bool):
         self._winner = value
 
@@ -56,3 +61,20 @@ class Player():
 
     def play(self, index: int) -> Card:
         return self._hand.pop(index)
+
+    def replace_hand(self, cards: list[Card]):
+        self._hand = cards
+
+    def unplay(self, index: int, card: Card):
+        self._hand.insert(index, card)
+
+    def undraw(self) -> Card:
+        return self._hand.pop()
+
+    def clone(self) -> Player:
+        player = Player(self._name, self._chips_color)
+        player._id = self._id
+        player._hand = list(self._hand)
+        player._winner = self._winner
+        player._sequences = self._sequences
+        return player
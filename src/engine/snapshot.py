@@ -0,0 +1,94 @@
+from __future__ import annotations
+from array import array
+from random import Random
+import struct
+
+from engine.board import Board, Status, chip_color
+from engine.card import CARDS
+from engine.deck import Deck
+from engine.player import Player
+
+# Layout, little endian:
+#   HEADER  magic, version, board size, players, teams, sequences to win, local seat, turn seat, status, deck size, discard size
+#   PLAYER  per seat: id, sequences, winner, hand size, name size (utf-8 bytes, up to 65535)
+#   bytes   board card ids, one per cell
+#   bytes   cell owners, one per cell: 0 for empty, seat + 1 otherwise
+#   bytes   in_sequence bitmask, one bit per cell
+#   bytes   draw pile card ids (top last), discard pile card ids (top first), hands in seat order, then the player names
+MAGIC = b"SEQS"
+VERSION = 2
+HEADER = struct.Struct("<4sBBBBBBBBBB")
+PLAYER = struct.Struct("<QBBBH")
+STATUSES: tuple[Status, ...] = tuple(Status)
+
+def serialize(board: Board) -> bytes:
+    players = board.players
+    cells = board.geometry.cells
+    deck = board.deck
+    seats = {player: seat + 1 for seat, player in enumerate(players)}
+    names = [player.name.encode("utf-8") for player in players]
+
+    data = bytearray(HEADER.pack(MAGIC, VERSION, board.geometry.size, len(players), board.owners, board.sequences_to_win,
+                                 players.index(board.local_player), players.index(board.turn_player),
+                                 STATUSES.index(board.match_status), len(deck.cards), len(deck.discard_pile)))
+    for player, name in zip(players, names):
+        data += PLAYER.pack(int(player.id), player.sequences, player.winner, len(player.hand), len(name))
+
+    cards = array("B", (place.card.id for place in board.board_places))
+    cards.extend(seats.get(place.player_in_place, 0) for place in board.board_places)
+    data += cards.tobytes()
+    data += board.bitboard.in_sequence.to_bytes((cells + 7) // 8, "little")
+
+    cards = array("B", (card.id for card in deck.cards))
+    cards.extend(card.id for card in deck.discard_pile)
+    for player in players:
+        cards.extend(card.id for card in player.hand)
+    data += cards.tobytes()
+    for name in names:
+        data += name
+    return bytes(data)
+
+def deserialize(data: bytes, random: Random = None) -> Board:
+    # random drives later reshuffles of the restored deck. The original generator state is not stored, so by default it is
+    # seeded from the snapshot itself: resuming the same snapshot twice reshuffles the same way, though not as the original match
+    magic, version, size, n_players, teams, sequences_to_win, local_seat, turn_seat, status, n_deck, n_discard = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Snapshot de partida inválido")
+    offset = HEADER.size
+    entries = []
+    for seat in range(n_players):
+        entries.append(PLAYER.unpack_from(data, offset))
+        offset += PLAYER.size
+
+    cells = size * size
+    board_cards = [CARDS[id] for id in data[offset:offset + cells]]
+    offset += cells
+    owners = [seat - 1 if seat else None for seat in data[offset:offset + cells]]
+    offset += cells
+    in_sequence_size = (cells + 7) // 8
+    in_sequence = int.from_bytes(data[offset:offset + in_sequence_size], "little")
+    offset += in_sequence_size
+
+    def take(count: int) -> list:
+        nonlocal offset
+        cards = [CARDS[id] for id in data[offset:offset + count]]
+        offset += count
+        return cards
+
+    deck = Deck.from_piles(take(n_deck), take(n_discard), random if random is not None else Random(bytes(data)))
+    hands = [take(hand_size) for id, sequences, winner, hand_size, name_size in entries]
+
+    players = []
+    for seat, (id, sequences, winner, hand_size, name_size) in enumerate(entries):
+        name = bytes(data[offset:offset + name_size]).decode("utf-8")
+        offset += name_size
+        player = Player(name, chip_color(seat, local_seat, teams))
+        player.initialize(str(id), name)
+        player.replace_hand(hands[seat])
+        player.add_sequences(sequences)
+        player.set_winner(bool(winner))
+        players.append(player)
+
+    board = Board(size)
+    board.restore(players, local_seat, teams, sequences_to_win, board_cards, deck, owners, in_sequence, turn_seat, STATUSES[status])
+    return board
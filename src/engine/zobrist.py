@@ -0,0 +1,75 @@
+from __future__ import annotations
+from collections import OrderedDict
+from random import Random
+
+ZOBRIST_SEED = 0x5E9E
+
+class ZobristKeys():
+    # Fixed seed, so every process (and every client) hashes the same position to the same value
+    def __init__(self, cells: int = 100, owners: int = 2) -> ZobristKeys:
+        random = Random(ZOBRIST_SEED + cells * 16 + owners)
+        self._cells: int = cells
+        self._owners: int = owners
+        self._chips: tuple[tuple[int, ...], ...] = tuple(tuple(random.getrandbits(64) for i in range(cells)) for o in range(owners))
+        self._in_sequence: tuple[int, ...] = tuple(random.getrandbits(64) for i in range(cells))
+        self._turn: tuple[int, ...] = tuple(random.getrandbits(64) for o in range(owners))
+
+    def __reduce__(self):
+        return (zobrist_keys, (self._cells, self._owners))
+
+    def chip(self, owner: int, index: int) -> int:
+        return self._chips[owner][index]
+
+    def in_sequence(self, index: int) -> int:
+        return self._in_sequence[index]
+
+    def turn(self, owner: int) -> int:
+        return self._turn[owner]
+
+_KEYS: dict[tuple[int, int], ZobristKeys] = {}
+
+def zobrist_keys(cells: int = 100, owners: int = 2) -> ZobristKeys:
+    key = (cells, owners)
+    if key not in _KEYS:
+        _KEYS[key] = ZobristKeys(cells, owners)
+    return _KEYS[key]
+
+class TranspositionCache():
+    # Bounded memo keyed by position hash; least recently used entries are evicted first
+    def __init__(self, max_entries: int = 1 << 18) -> TranspositionCache:
+        self._max_entries: int = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
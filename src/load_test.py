@@ -0,0 +1,280 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+from random import Random
+from time import perf_counter, process_time, time
+import asyncio
+import json
+import os
+import sys
+
+import aiohttp
+
+from engine.board import Board, Status
+from bots.policy import Policy, RandomPolicy, GreedyPolicy
+from bots.registry import POLICIES, make_policy
+from dog.async_dog_proxy import AsyncDogProxy
+from dog.dog_proxy import CONNECT_TIMEOUT, READ_TIMEOUT
+from dog.start_status import StartStatus
+
+# Idle clients ask for a new match every START_MIN to START_MAX seconds (jittered so they do not ask in lockstep)
+START_MIN = 0.05
+START_MAX = 0.25
+PERCENTILES = (0.5, 0.9, 0.99)
+# Policies that answer in microseconds run on the event loop; the others think for their whole budget and run on a thread
+INLINE_POLICIES = (RandomPolicy.name, GreedyPolicy.name)
+
+class Stats():
+    def __init__(self) -> Stats:
+        self.matches: int = 0
+        self.moves: int = 0
+        self.requests: int = 0
+        self.errors: int = 0
+        self.withdrawals: int = 0
+        # Seconds from sending a move to an opponent's client handing it to its bot
+        self.latencies: list[float] = []
+
+class LoadProxy(AsyncDogProxy):
+    # Counts each request once, after the proxy's own retries, and each one that still failed
+    def __init__(self, stats: Stats, session: aiohttp.ClientSession, url: str) -> LoadProxy:
+        super().__init__(session, url)
+        self.stats = stats
+
+    async def post(self, path, post_data, retry_read=True):
+        self.stats.requests += 1
+        try:
+            status, text = await super().post(path, post_data, retry_read)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.stats.errors += 1
+            raise
+        if status != 200:
+            self.stats.errors += 1
+        return (status, text)
+
+class LoadClient():
+    # A headless player: the proxy polls the server and hands starts and moves to this client, which answers with its bot
+    def __init__(self, player_id: str, name: str, game_id: str, sequences_to_win: int, policy: Policy, proxy: LoadProxy, stats: Stats,
+                 executor: ThreadPoolExecutor) -> LoadClient:
+        self._name: str = name
+        self._sequences_to_win: int = sequences_to_win
+        self._policy: Policy = policy
+        self._executor: ThreadPoolExecutor = executor if policy.name not in INLINE_POLICIES else None
+        self._proxy: LoadProxy = proxy
+        self._stats: Stats = stats
+        self._board: Board = None
+        self._turn: asyncio.Task = None
+        # Ids are given here instead of by AsyncDogProxy.initialize, whose millisecond clock repeats across clients created together
+        proxy.player_id = player_id
+        proxy.player_name = name
+        proxy.game_id = game_id
+        proxy.dog_actor = self
+
+    @property
+    def in_match(self) -> bool:
+        return self._proxy.status == 3
+
+    async def register(self) -> bool:
+        try:
+            result, text = await self._proxy.register_player(self._name, self._proxy.player_id, self._proxy.game_id)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+        if result == 200:
+            self._proxy.status = 2
+        return result == 200
+
+    async def run(self, number_of_players: int, deadline: float, random: Random):
+        if not await self.register():
+            return
+        loop = asyncio.get_running_loop()
+        poller = loop.create_task(self._proxy.poll())
+        # Whoever is idle asks for a match; the others waiting may be pulled into it and learn about it by polling started/
+        while loop.time() < deadline:
+            if self._proxy.status == 2:
+                start_status = await self._proxy.start_match(number_of_players)
+                if start_status.get_code() == "2":
+                    self.receive_start(start_status)
+            await asyncio.sleep(max(0, min(random.uniform(START_MIN, START_MAX), deadline - loop.time())))
+
+        if self._turn is not None:
+            self._turn.cancel()
+        await self._proxy.close()
+        await poller
+
+    def close(self):
+        self._policy.close()
+
+    def receive_start(self, start_status: StartStatus):
+        self._board = Board()
+        self._board.start_match(start_status.get_players(), start_status.get_local_id(), sequences_to_win=self._sequences_to_win)
+        self.__play_if_turn()
+
+    def receive_move(self, a_move: dict):
+        sent_at = a_move.get("sent_at")
+        if sent_at is not None:
+            self._stats.latencies.append(time() - sent_at)
+        self._board.receive_move(a_move)
+        self.__play_if_turn()
+
+    def receive_withdrawal_notification(self):
+        self._stats.withdrawals += 1
+        self._board.receive_withdrawal_notification()
+
+    def __play_if_turn(self):
+        if self._board.match_status == Status.YOUR_TURN_CARD and (self._turn is None or self._turn.done()):
+            self._turn = asyncio.get_running_loop().create_task(self.__play_turn())
+
+    async def __play_turn(self):
+        # A dead card keeps the turn, hence the loop
+        loop = asyncio.get_running_loop()
+        while self._board.match_status == Status.YOUR_TURN_CARD:
+            if self._executor is None:
+                hand_index, board_index = self._policy.choose_move(self._board)
+            else:
+                # Off the event loop the other clients keep polling meanwhile. The bot gets a copy, as a withdrawal can
+                # still reach the board while it thinks
+                hand_index, board_index = await loop.run_in_executor(self._executor, self._policy.choose_move, self._board.clone())
+                if self._board.match_status != Status.YOUR_TURN_CARD:
+                    return
+            moves = [self._board.pick_card(hand_index)[0]]
+            if board_index is not None:
+                moves.append(self._board.select_board_place(board_index)[0])
+            for move in moves:
+                move["sent_at"] = time()
+                try:
+                    await self._proxy.send_move(move)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    return  #   already counted as an error; the match stalls and is reported as still running
+                self._stats.moves += 1
+            if self._board.match_status == Status.FINISHED:
+                self._stats.matches += 1
+
+async def run_clients(task: tuple) -> dict:
+    first, count, run_id, url, game_id, number_of_players, sequences_to_win, policy_name, seed, move_time, duration, connections = task
+    stats = Stats()
+    timeout = aiohttp.ClientTimeout(sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT)
+    # One thread for the search bots: they hold the GIL while thinking, so more threads would only slow each move down
+    # (--workers spreads them over more cores)
+    executor = ThreadPoolExecutor(max_workers=1)
+    async with aiohttp.ClientSession(timeout=timeout, connector=aiohttp.TCPConnector(limit=connections)) as session:
+        clients = []
+        for index in range(first, first + count):
+            proxy = LoadProxy(stats, session, url)
+            policy = make_policy(policy_name, seed + index, move_time)
+            clients.append(LoadClient(str(run_id * 10 ** 6 + index), "Bot " + str(index), game_id, sequences_to_win, policy, proxy, stats, executor))
+
+        start = perf_counter()
+        cpu = process_time()
+        deadline = asyncio.get_running_loop().time() + duration
+        await asyncio.gather(*(client.run(number_of_players, deadline, Random(seed + index)) for index, client in zip(range(first, first + count), clients)))
+        elapsed = perf_counter() - start
+        cpu = process_time() - cpu
+
+        in_match = sum(client.in_match for client in clients)
+        # Cancelled turns may still be thinking; their policies are closed only after they return
+        executor.shutdown(wait=True)
+        for client in clients:
+            client.close()
+
+    return {
+        "clients": count,
+        "matches": stats.matches,
+        "moves": stats.moves,
+        "requests": stats.requests,
+        "errors": stats.errors,
+        "withdrawals": stats.withdrawals,
+        "in_match": in_match,
+        "latencies": stats.latencies,
+        "cpu": cpu,
+        "time": elapsed,
+    }
+
+def run_worker(task: tuple) -> dict:
+    # Board and proxy print every move; written to the terminal that would dominate the client CPU being measured
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        return asyncio.run(run_clients(task))
+
+def percentile(values: list[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+def main(argv: list[str] = None):
+    parser = ArgumentParser(description="Teste de carga: muitos clientes sem GUI, cada um com um bot, jogando partidas via DOG")
+    parser.add_argument("-c", "--clients", type=int, default=100)
+    parser.add_argument("-w", "--workers", type=int, default=1, help="processos; os clientes são divididos entre eles")
+    parser.add_argument("-d", "--duration", type=float, default=30, help="duração da medição, em segundos")
+    parser.add_argument("-u", "--url", help="endereço do servidor DOG (padrão: DOG_SERVER_URL ou o servidor público)")
+    parser.add_argument("-g", "--game-id", help="identificador do jogo (padrão: config/game.id)")
+    parser.add_argument("--players", type=int, default=2, help="jogadores por partida")
+    parser.add_argument("--sequences", type=int, help="sequências para vencer, iguais em todos os clientes (padrão: a da variante jogada)")
+    parser.add_argument("--connections", type=int, default=100, help="conexões simultâneas por processo")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="semente base; o cliente i usa seed + i")
+    parser.add_argument("-p", "--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--move-time", type=float, help="tempo por jogada, em segundos, das políticas de busca")
+    parser.add_argument("-o", "--output", help="arquivo JSON com o resumo da medição (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    game_id = args.game_id
+    if game_id is None:
+        try:
+            with open("config/game.id", "r") as config_file:
+                game_id = config_file.read()
+        except FileNotFoundError:
+            game_id = "load-test"
+
+    # Same clock as AsyncDogProxy.generate_player_id, with room for a million clients per run
+    run_id = int(time() * 1000) - 1639872000000
+    tasks = []
+    first = 0
+    for worker in range(args.workers):
+        count = args.clients // args.workers + (worker < args.clients % args.workers)
+        tasks.append((first, count, run_id, args.url, game_id, args.players, args.sequences, args.policy, args.seed, args.move_time, args.duration, args.connections))
+        first += count
+
+    with Pool(args.workers) as pool:
+        results = pool.map(run_worker, tasks)
+
+    elapsed = max(result["time"] for result in results)
+    matches = sum(result["matches"] for result in results)
+    requests = sum(result["requests"] for result in results)
+    errors = sum(result["errors"] for result in results)
+    cpu = sum(result["cpu"] for result in results)
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+    summary = {
+        "clients": args.clients,
+        "workers": args.workers,
+        "players": args.players,
+        "policy": args.policy,
+        "time": round(elapsed, 3),
+        "matches": matches,
+        "matches_per_second": round(matches / elapsed, 3),
+        "moves": sum(result["moves"] for result in results),
+        "requests": requests,
+        "errors": errors,
+        "error_rate": round(errors / requests, 6) if requests else 0,
+        "withdrawals": sum(result["withdrawals"] for result in results),
+        "in_match": sum(result["in_match"] for result in results),
+        "latency_ms": {("p%g" % (fraction * 100)): round(percentile(latencies, fraction) * 1000, 3) for fraction in PERCENTILES} if latencies else {},
+        "cpu": round(cpu, 3),
+        "cpu_per_match_ms": round(cpu / matches * 1000, 3) if matches else None,
+    }
+    if latencies:
+        summary["latency_ms"]["max"] = round(latencies[-1] * 1000, 3)
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        output.write(json.dumps(summary) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print("%d clientes, %d partidas em %.2f s (%.1f partidas/s)" % (args.clients, matches, elapsed, summary["matches_per_second"]), file=sys.stderr)
+    if latencies:
+        print("latência jogada -> oponente: " + ", ".join("%s %.1f ms" % item for item in summary["latency_ms"].items()), file=sys.stderr)
+    print("%d requisições (%.1f/s), %d erros (%.2f%%), %d desistências, %d clientes ainda em partida"
+          % (requests, requests / elapsed, errors, summary["error_rate"] * 100, summary["withdrawals"], summary["in_match"]), file=sys.stderr)
+    if matches:
+        print("CPU dos clientes: %.1f ms por partida (%.0f%% de %d processo(s))" % (summary["cpu_per_match_ms"], cpu / elapsed / args.workers * 100, args.workers), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
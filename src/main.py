@@ -1,3 +1,5 @@
 from GUI import GUI
 
-GUI()
+# The MCTS opponent spawns worker processes, which re-import this script: only the parent opens the window
+if __name__ == "__main__":
+    GUI()
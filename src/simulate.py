@@ -0,0 +1,92 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from multiprocessing import Pool
+from time import perf_counter
+import json
+import os
+import sys
+
+from engine.board import Board, Status
+from bots.registry import POLICIES, make_policy
+
+def play_match(task: tuple) -> dict:
+    index, seed, policy_names, max_turns, move_time = task
+    start = perf_counter()
+
+    # Seats alternate who plays first so neither policy always has the opening move
+    first = index % 2
+    players = [["Bot 0", "0", "1" if first == 0 else "2"], ["Bot 1", "1", "2" if first == 0 else "1"]]
+    board = Board()
+    board.start_match(players, "0", seed)
+    policies = [make_policy(name, seed * 2 + seat, move_time) for seat, name in enumerate(policy_names)]
+
+    # Seats are the player ids; the board orders its players by turn instead
+    seats = sorted(board.players, key=lambda player: int(player.id))
+    turns = 0
+    dead_cards = [0, 0]
+    while board.match_status != Status.FINISHED and turns < max_turns:
+        seat = int(board.turn_player.id)
+        move = policies[seat].choose_move(board)
+        board.apply_move(move)
+        if move[1] is None:
+            dead_cards[seat] += 1
+        else:
+            turns += 1
+
+    for policy in policies:
+        policy.close()
+
+    winner = None
+    for seat, player in enumerate(seats):
+        if player.winner:
+            winner = seat
+    return {
+        "match": index,
+        "seed": seed,
+        "policies": list(policy_names),
+        "first": first,
+        "winner": winner,
+        "turns": turns,
+        "sequences": [player.sequences for player in seats],
+        "dead_cards": dead_cards,
+        "time": round(perf_counter() - start, 6),
+    }
+
+def main(argv: list[str] = None):
+    parser = ArgumentParser(description="Simula partidas de Sequência entre bots, sem GUI e sem DOG")
+    parser.add_argument("-n", "--matches", type=int, default=100)
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("-s", "--seed", type=int, default=0, help="semente base; a partida i usa seed + i")
+    parser.add_argument("-a", "--policy-a", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("-b", "--policy-b", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--move-time", type=float, help="tempo por jogada, em segundos, das políticas de busca")
+    parser.add_argument("-o", "--output", help="arquivo JSON lines com o resultado de cada partida (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    tasks = [(i, args.seed + i, (args.policy_a, args.policy_b), args.max_turns, args.move_time) for i in range(args.matches)]
+    output = open(args.output, "w") if args.output else sys.stdout
+    wins = [0, 0]
+    draws = 0
+    turns = 0
+    start = perf_counter()
+    try:
+        with Pool(args.workers) as pool:
+            for result in pool.imap_unordered(play_match, tasks, chunksize=max(1, args.matches // (args.workers * 8))):
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+                turns += result["turns"]
+                if result["winner"] is None:
+                    draws += 1
+                else:
+                    wins[result["winner"]] += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = perf_counter() - start
+    print(args.policy_a + ": " + str(wins[0]) + " vitórias, " + args.policy_b + ": " + str(wins[1]) + " vitórias, " + str(draws) + " sem vencedor", file=sys.stderr)
+    print("%d partidas, %d turnos em %.2f s (%.1f partidas/s)" % (args.matches, turns, elapsed, args.matches / elapsed), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+from os import path, listdir, makedirs, replace, remove, fdopen, chmod
+from io import BytesIO
+import hashlib
+import json
+import mmap
+import struct
+import tempfile
+
+ATLAS_PATH = path.join(path.dirname(path.abspath(__file__)), "..", "build", "cards.atlas")
+MAGIC = b"SEQATLS1"
+HEADER = struct.Struct("<8sI")
+
+def fingerprint(img_dir: str, sizes: tuple) -> str:
+    digest = hashlib.sha1(repr(sorted(sizes)).encode())
+    for file in sorted(listdir(img_dir)):
+        if file.endswith(".png"):
+            stat = path.getsize(path.join(img_dir, file)), path.getmtime(path.join(img_dir, file))
+            digest.update((file + repr(stat)).encode())
+    return digest.hexdigest()
+
+def entry_key(file: str, size: tuple[int, int]) -> str:
+    return file + "@" + str(size[0]) + "x" + str(size[1])
+
+def build_atlas(img_dir: str, sizes: tuple, atlas_path: str = ATLAS_PATH):
+    from PIL import Image
+
+    entries = {}
+    blobs = BytesIO()
+    for file in sorted(listdir(img_dir)):
+        if not file.endswith(".png"):
+            continue
+        with Image.open(path.join(img_dir, file)) as source:
+            for size in sizes:
+                # Stored PNGs are left uncompressed so Tk can load them without inflating
+                blob = BytesIO()
+                source.resize(size).save(blob, format="PNG", compress_level=0)
+                entries[entry_key(file, size)] = (blobs.tell(), blob.tell())
+                blobs.write(blob.getvalue())
+
+    index = json.dumps({"fingerprint": fingerprint(img_dir, sizes), "entries": entries}).encode()
+    makedirs(path.dirname(atlas_path), exist_ok=True)
+    # Each process writes its own temporary file, so clients starting together never truncate each other's atlas
+    descriptor, temp_path = tempfile.mkstemp(dir=path.dirname(atlas_path), suffix=".tmp")
+    try:
+        with fdopen(descriptor, "wb") as atlas_file:
+            atlas_file.write(HEADER.pack(MAGIC, len(index)))
+            atlas_file.write(index)
+            atlas_file.write(blobs.getvalue())
+        # mkstemp creates the file readable by its owner only
+        chmod(temp_path, 0o644)
+        replace(temp_path, atlas_path)
+    except BaseException:
+        remove(temp_path)
+        raise
+
+class SpriteAtlas:
+    def __init__(self, atlas_path: str = ATLAS_PATH) -> SpriteAtlas:
+        with open(atlas_path, "rb") as atlas_file:
+            self._data: mmap.mmap = mmap.mmap(atlas_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError("Arquivo de atlas inválido: " + atlas_path)
+        index = json.loads(self._data[HEADER.size:HEADER.size + index_length])
+        self._fingerprint: str = index["fingerprint"]
+        self._base: int = HEADER.size + index_length
+        self._entries: dict[str, list[int]] = index["entries"]
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    def has(self, file: str, size: tuple[int, int]) -> bool:
+        return entry_key(file, size) in self._entries
+
+    def blob(self, file: str, size: tuple[int, int]) -> bytes:
+        offset, length = self._entries[entry_key(file, size)]
+        start = self._base + offset
+        return self._data[start:start + length]
+
+    def close(self):
+        self._data.close()
+
+def load_atlas(img_dir: str, sizes: tuple, atlas_path: str = ATLAS_PATH) -> SpriteAtlas:
+    # Rebuilds the atlas when it is missing or img/ changed since it was written
+    current = fingerprint(img_dir, sizes)
+    atlas = None
+    if path.exists(atlas_path):
+        try:
+            atlas = SpriteAtlas(atlas_path)
+        except (OSError, ValueError):
+            atlas = None
+    if atlas is None or atlas.fingerprint != current:
+        if atlas is not None:
+            atlas.close()
+        build_atlas(img_dir, sizes, atlas_path)
+        atlas = SpriteAtlas(atlas_path)
+    return atlas
+
+if __name__ == "__main__":
+    from card_images import IMG_DIR, SIZES
+
+    build_atlas(IMG_DIR, SIZES)
+    print("Atlas gerado em " + path.abspath(ATLAS_PATH))
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from time import perf_counter
+
+FIRST_WINDOW = "Primeira janela"
+CONNECTED = "Conectado"
+BOARD_READY = "Tabuleiro pronto"
+
+class StartupTimer:
+    def __init__(self) -> StartupTimer:
+        self._start: float = perf_counter()
+        self._marks: dict[str, float] = {}
+        self._reported: bool = False
+
+    def mark(self, name: str):
+        if name not in self._marks:
+            self._marks[name] = perf_counter() - self._start
+
+    def elapsed(self, name: str) -> float:
+        return self._marks.get(name)
+
+    def report(self) -> str:
+        lines = []
+        for name in (FIRST_WINDOW, CONNECTED, BOARD_READY):
+            elapsed = self._marks.get(name)
+            lines.append(name + ": " + ("-" if elapsed is None else "%.3f s" % elapsed))
+        return "\n".join(lines)
+
+    def report_once(self):
+        if not self._reported:
+            self._reported = True
+            print("Tempos de inicialização\n" + self.report())
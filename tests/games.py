@@ -0,0 +1,49 @@
+from __future__ import annotations
+from contextlib import redirect_stdout
+from random import Random
+import io
+import unittest
+
+from engine.board import Board, Status
+
+def make_players(count: int, first_id: int = 1) -> list[list[str]]:
+    return [["Jogador " + str(seat), str(first_id + seat), str(seat + 1)] for seat in range(count)]
+
+def start(count: int, seed: int, size: int = 10) -> Board:
+    board = Board(size)
+    board.start_match(make_players(count), "1", seed)
+    return board
+
+def any_move(board: Board, random: Random) -> tuple[int, int]:
+    moves = board.legal_moves()
+    return random.choice(moves) if moves else (random.choice(board.dead_cards()), None)
+
+def positions(board: Board, random: Random, turns: int):
+    # Yields the board before each of up to turns random moves
+    for turn in range(turns):
+        if board.match_status == Status.FINISHED:
+            return
+        yield board
+        board.apply_move(any_move(board, random))
+
+def fingerprint(board: Board) -> tuple:
+    bitboard = board.bitboard
+    owners = range(board.owners)
+    return (
+        tuple((place.player_in_place.id if place.player_in_place else None, place.in_sequence) for place in board.board_places),
+        tuple((player.id, tuple(player.hand), player.sequences, player.winner) for player in board.players),
+        tuple(board.deck.cards),
+        tuple(board.deck.discard_pile),
+        board.turn_player.id,
+        board.match_status,
+        board.zobrist_hash,
+        tuple(tuple(bitboard.open_windows(owner)) for owner in owners),
+        tuple(tuple(bitboard.threats(owner)) for owner in owners),
+    )
+
+class EngineTest(unittest.TestCase):
+    def setUp(self):
+        # The engine prints every move it plays
+        quiet = redirect_stdout(io.StringIO())
+        quiet.__enter__()
+        self.addCleanup(quiet.__exit__, None, None, None)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from engine.board import Board, Status
+from bots.policy import position_score
+from bots.registry import make_policy
+from tests.games import EngineTest, start
+
+def greedy_positions(count: int, seed: int, size: int = 10, every: int = 4) -> list[Board]:
+    # Greedy bots make sequences, which random moves rarely do
+    board = start(count, seed=seed, size=size)
+    policy = make_policy("greedy", seed)
+    positions = []
+    for turn in range(300):
+        if board.match_status == Status.FINISHED:
+            break
+        if turn % every == 0:
+            positions.append(board.clone())
+        board.apply_move(policy.choose_move(board))
+    positions.append(board.clone())
+    return positions
+
+@unittest.skipUnless(numpy, "numpy não instalado")
+class BatchEvaluatorTest(EngineTest):
+    def test_matches_the_incremental_counters(self):
+        from bots.batch_eval import BatchEvaluator, stack_grids
+
+        for count, size in ((2, 10), (3, 10), (4, 12)):
+            boards = greedy_positions(count, seed=count, size=size)
+            evaluator = BatchEvaluator(boards[0].geometry, boards[0].owners)
+            open_windows = evaluator.open_windows(stack_grids(boards))
+            threats, sequences = evaluator.count_boards(boards)
+            scores = evaluator.score_boards(boards)
+            for batch, board in enumerate(boards):
+                for owner in range(board.owners):
+                    self.assertEqual(list(open_windows[batch, owner]), board.bitboard.open_windows(owner))
+                    self.assertEqual(list(threats[batch, owner]), board.bitboard.open_windows(owner)[1:-1])
+                    self.assertEqual(sequences[batch, owner], board.sequences(owner))
+                    self.assertEqual(scores[batch, owner], position_score(board, owner))
+            # Lines longer than a sequence are where full windows and sequences part ways
+            self.assertGreater(sequences.sum(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
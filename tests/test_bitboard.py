@@ -0,0 +1,91 @@
+from __future__ import annotations
+from random import Random
+import unittest
+
+from engine.board import Board, BitBoard
+from engine.card import Suit
+from engine.zobrist import zobrist_keys
+from tests.games import EngineTest, positions, start
+
+def cell_owners(board: Board) -> list[int]:
+    # None for empty cells, -1 for jokers
+    owners = []
+    for place in board.board_places:
+        if place.card.suit == Suit.JOKER:
+            owners.append(-1)
+        else:
+            owners.append(None if place.player_in_place is None else board.owner(place.player_in_place))
+    return owners
+
+def brute_open_windows(board: Board, owner: int) -> list[int]:
+    geometry = board.geometry
+    cells = cell_owners(board)
+    histogram = [0] * (geometry.sequence_length + 1)
+    for window in geometry.window_cells:
+        if all(cells[index] in (None, -1, owner) for index in window):
+            histogram[sum(cells[index] in (-1, owner) for index in window)] += 1
+    return histogram
+
+def brute_threats(board: Board, owner: int) -> list[int]:
+    geometry = board.geometry
+    cells = cell_owners(board)
+    threats = [0] * geometry.cells
+    for window in geometry.window_cells:
+        if all(cells[index] in (None, -1, owner) for index in window):
+            if sum(cells[index] in (-1, owner) for index in window) >= geometry.sequence_length - 2:
+                for index in window:
+                    threats[index] += 1
+    return threats
+
+def brute_hash(board: Board) -> int:
+    keys = zobrist_keys(board.geometry.cells, board.owners)
+    hash = keys.turn(board.owner(board.turn_player))
+    for index, place in enumerate(board.board_places):
+        if place.player_in_place is not None:
+            hash ^= keys.chip(board.owner(place.player_in_place), index)
+        if place.in_sequence:
+            hash ^= keys.in_sequence(index)
+    return hash
+
+class SequenceRuleTest(EngineTest):
+    def test_new_sequence_shares_at_most_one_chip(self):
+        bitboard = BitBoard(0)
+        for index in range(5):
+            bitboard.put_chip(index, 0)
+        self.assertEqual(len(bitboard.new_sequences(4, 0)), 1)
+        bitboard.mark_sequence(bitboard.new_sequences(4, 0)[0])
+
+        # A sixth chip in the row would reuse four chips of the first sequence
+        bitboard.put_chip(5, 0)
+        self.assertEqual(bitboard.new_sequences(5, 0), [])
+
+        # Nine in a row are two sequences sharing the middle chip
+        for index in range(6, 9):
+            bitboard.put_chip(index, 0)
+        self.assertEqual(len(bitboard.new_sequences(8, 0)), 1)
+
+    def test_column_and_diagonals(self):
+        columns = 10
+        for step in (columns, columns + 1, columns - 1):
+            bitboard = BitBoard(0)
+            first = 4 if step == columns - 1 else 0
+            cells = [first + step * offset for offset in range(5)]
+            for index in cells[:-1]:
+                bitboard.put_chip(index, 1)
+                self.assertEqual(bitboard.new_sequences(index, 1), [])
+            bitboard.put_chip(cells[-1], 1)
+            self.assertEqual(len(bitboard.new_sequences(cells[-1], 1)), 1, step)
+            self.assertEqual(bitboard.new_sequences(cells[-1], 0), [])
+
+class IncrementalCountersTest(EngineTest):
+    def test_counters_match_brute_force(self):
+        for count, size in ((2, 10), (3, 10), (4, 12)):
+            random = Random(size + count)
+            for position in positions(start(count, seed=7, size=size), random, 80):
+                self.assertEqual(position.zobrist_hash, brute_hash(position))
+                for owner in range(position.owners):
+                    self.assertEqual(position.bitboard.open_windows(owner), brute_open_windows(position, owner))
+                    self.assertEqual(position.bitboard.threats(owner), brute_threats(position, owner))
+
+if __name__ == "__main__":
+    unittest.main()
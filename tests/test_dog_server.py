@@ -0,0 +1,97 @@
+from __future__ import annotations
+from random import Random
+import ast
+import json
+import unittest
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+if aiohttp is not None:
+    from aiohttp.test_utils import TestClient, TestServer
+    from dog_server import DogServer, Game, Match
+
+def players(count: int) -> list[list[str]]:
+    return [["Jogador " + str(seat), str(seat + 1), str(seat + 1)] for seat in range(count)]
+
+@unittest.skipUnless(aiohttp, "aiohttp não instalado")
+class MatchQueueTest(unittest.TestCase):
+    def test_move_order_keeps_moves_until_acknowledged(self):
+        match = Match(players(2))
+        first = match.add_move("1", {"match_status": "next"})
+        match.add_move("1", {"match_status": "next"})
+        # A poll whose response was lost is repeated with the same move_order and gets the same move
+        self.assertEqual(match.next_move("2", 0)["order"], first)
+        self.assertEqual(match.next_move("2", 0)["order"], first)
+        self.assertEqual(match.next_move("2", first)["order"], first + 1)
+        self.assertIsNone(match.next_move("2", first + 1))
+        self.assertFalse(match.pending())
+
+    def test_without_move_order_each_move_comes_once(self):
+        # As from the real server, which clients that do not send move_order expect
+        match = Match(players(3))
+        match.add_move("1", {"match_status": "next"})
+        self.assertEqual(match.next_move("2")["player"], "1")
+        self.assertIsNone(match.next_move("2"))
+        self.assertTrue(match.pending())
+        self.assertEqual(match.next_move("3")["player"], "1")
+        self.assertFalse(match.pending())
+
+@unittest.skipUnless(aiohttp, "aiohttp não instalado")
+class GameStartTest(unittest.TestCase):
+    def setUp(self):
+        self.game = Game()
+        for id in "1234":
+            self.game.register(id, "Jogador " + id)
+
+    def test_takes_the_first_waiting_players(self):
+        self.assertEqual(self.game.start("5", 2, Random(0))[0], "0")
+        code, message, match = self.game.start("3", 3, Random(0))
+        self.assertEqual(code, "2")
+        self.assertEqual(sorted(player[1] for player in match.players), ["1", "2", "3"])
+        self.assertEqual(self.game.start("4", 2, Random(0))[0], "1")
+
+    def test_waits_until_the_last_match_is_read(self):
+        code, message, match = self.game.start("1", 2, Random(0))
+        match.add_move("1", {"match_status": "finished"})
+        self.game.finish(match)
+        # Player 2 has not read the final move yet, so 1 cannot pull it into a new match
+        self.game.leave("1")
+        self.assertEqual(self.game.start("1", 4, Random(0))[0], "1")
+        self.assertEqual(sorted(player[1] for player in self.game.start("1", 3, Random(0))[2].players), ["1", "3", "4"])
+
+@unittest.skipUnless(aiohttp, "aiohttp não instalado")
+class DogServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = TestClient(TestServer(DogServer(seed=0).application()))
+        await self.client.start_server()
+        self.addAsyncCleanup(self.client.close)
+
+    async def post(self, path: str, **form) -> dict:
+        async with self.client.post("/" + path, data=dict(form, game_id="jogo")) as resp:
+            self.assertEqual(resp.status, 200)
+            return json.loads(await resp.text())
+
+    async def test_match_polls(self):
+        for id in "12":
+            await self.post("player/", player_id=id, player_name="Jogador " + id)
+        start = await self.post("start/", player_id="1", number_of_players="2")
+        self.assertEqual(start["code"], "2")
+        self.assertEqual((await self.post("started/", player_id="2"))["code"], "2")
+        await self.post("move/", player_id="1", move=json.dumps({"match_status": "next"}))
+        await self.post("move/", player_id="1", move=json.dumps({"match_status": "next"}))
+
+        # With move_order the same move comes back until it is acknowledged
+        first = await self.post("match/", player_id="2", move_order="0")
+        self.assertEqual(await self.post("match/", player_id="2", move_order="0"), first)
+        self.assertEqual(ast.literal_eval(first["1"])["order"], 1)
+        second = await self.post("match/", player_id="2", move_order="1")
+        self.assertEqual(ast.literal_eval(second["1"])["order"], 2)
+        # Without it each poll takes the move it gets, as the real server does
+        self.assertEqual(await self.post("match/", player_id="2"), second)
+        self.assertEqual(await self.post("match/", player_id="2"), {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from random import Random
+import unittest
+
+from engine.board import Board, Status
+from tests.games import EngineTest, any_move, fingerprint, make_players, positions, start
+
+class MoveRulesTest(EngineTest):
+    def test_board_clicks_agree_with_legal_moves(self):
+        # select_board_place (GUI and DOG path) and legal_moves (bots) must accept the same cells, teams included
+        for count in (2, 4, 6):
+            random = Random(count)
+            for position in positions(start(count, seed=count), random, 60):
+                legal = set(position.legal_moves())
+                dead = set(position.dead_cards())
+                for hand_index, card in enumerate(position.turn_player.hand):
+                    if hand_index in dead:
+                        continue
+                    if card.is_one_eye_jack():
+                        cells = [index for index, place in enumerate(position.board_places) if place.player_in_place is not None]
+                    else:
+                        cells = random.sample(range(len(position.board_places)), 10)
+                        cells += [index for (hand, index) in legal if hand == hand_index]
+                    for index in cells:
+                        trial = position.clone()
+                        trial.pick_card(hand_index)
+                        accepted = trial.select_board_place(index)[0] != {}
+                        self.assertEqual(accepted, (hand_index, index) in legal, (count, card, index))
+
+class ReplicaTest(EngineTest):
+    def test_clients_stay_in_sync(self):
+        # Every client plays its own turns through the GUI calls and replays the others' moves
+        for count in (2, 3, 4, 6):
+            random = Random(count)
+            players = make_players(count)
+            boards = []
+            for player in players:
+                board = Board()
+                board.start_match(players, player[1])
+                boards.append(board)
+            for turn in range(150):
+                playing = [board for board in boards if board.match_status == Status.YOUR_TURN_CARD]
+                if not playing:
+                    break
+                self.assertEqual(len(playing), 1)
+                board = playing[0]
+                hand_index, board_index = any_move(board, random)
+                moves = [board.pick_card(hand_index)[0]]
+                if board_index is not None:
+                    moves.append(board.select_board_place(board_index)[0])
+                for other in boards:
+                    if other is not board:
+                        for move in moves:
+                            other.receive_move(move)
+            expected = fingerprint(boards[0])[:5]
+            for board in boards[1:]:
+                self.assertEqual(fingerprint(board)[:5], expected)
+
+if __name__ == "__main__":
+    unittest.main()
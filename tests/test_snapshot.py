@@ -0,0 +1,48 @@
+from __future__ import annotations
+from random import Random
+import unittest
+
+from engine.board import Board
+from engine.snapshot import serialize, deserialize
+from tests.games import EngineTest, any_move, fingerprint, make_players, positions, start
+
+class SnapshotTest(EngineTest):
+    def test_snapshot_round_trips(self):
+        for count, size in ((2, 10), (3, 10), (4, 12)):
+            random = Random(count)
+            for position in positions(start(count, seed=3, size=size), random, 60):
+                restored = deserialize(serialize(position))
+                self.assertEqual(fingerprint(restored), fingerprint(position))
+                self.assertEqual(restored.local_player.id, position.local_player.id)
+                self.assertEqual(restored.sequences_to_win, position.sequences_to_win)
+                self.assertEqual(sorted(restored.legal_moves()), sorted(position.legal_moves()))
+
+    def test_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            deserialize(b"XXXX" + bytes(40))
+
+    def test_keeps_long_names(self):
+        # GUI names come from a dialog with no length limit
+        players = make_players(2)
+        players[0][0] = "Jogadora " + "ç" * 300
+        board = Board()
+        board.start_match(players, "1", 1)
+        restored = deserialize(serialize(board))
+        self.assertEqual(restored.players[0].name, players[0][0])
+        self.assertEqual(fingerprint(restored), fingerprint(board))
+
+    def test_resuming_twice_reshuffles_the_same_way(self):
+        board = start(2, seed=4)
+        random = Random(4)
+        while len(board.deck.cards) > 2:
+            board.apply_move(any_move(board, random))
+        data = serialize(board)
+        resumed = [deserialize(data) for copy in range(2)]
+        for turn in range(8):
+            move = any_move(resumed[0], random)
+            for copy in resumed:
+                copy.apply_move(move)
+        self.assertEqual(fingerprint(resumed[0]), fingerprint(resumed[1]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+import unittest
+
+from engine.board import Board, Status
+from bots.alphabeta import AlphaBetaSolver, WIN, is_proven
+from bots.mcts import MCTSPolicy
+from tests.games import EngineTest, start
+
+def position(count: int, chips: dict[int, int], hands: list[list[int]]) -> Board:
+    # chips maps cells to seats; each hand holds the cards of the given cells. Seat 0 is to move, each seat is its own team
+    # and a single sequence wins
+    board = start(count, seed=0)
+    cards = [place.card for place in board.board_places]
+    players = board.players
+    for player, hand in zip(players, hands):
+        player.replace_hand([cards[index] for index in hand])
+    owners = [chips.get(index) for index in range(len(cards))]
+    restored = Board()
+    restored.restore(players, 0, board.owners, 1, cards, board.deck, owners, 0, 0, Status.YOUR_TURN_CARD)
+    return restored
+
+# Cells whose cards (both copies) lie far from row 1, where the sequences below are built
+QUIET = [[60, 62, 63], [64, 66, 67], [72, 74, 75]]
+
+class SolverTest(EngineTest):
+    def test_finds_an_immediate_win(self):
+        board = position(2, {11: 0, 12: 0, 13: 0, 14: 0}, [[15] + QUIET[0], QUIET[1]])
+        move, score, depth = AlphaBetaSolver(5.0).solve(board)
+        self.assertEqual(move[1], 15)
+        self.assertEqual(score, WIN - 1)
+
+    def test_sees_an_opponent_win(self):
+        board = position(2, {11: 1, 12: 1, 13: 1, 14: 1}, [QUIET[0], [15] + QUIET[1]])
+        move, score, depth = AlphaBetaSolver(5.0).solve(board)
+        self.assertEqual(score, -(WIN - 2))
+
+    def test_third_team_win_is_a_loss(self):
+        # Team C wins on the third ply and neither A nor B can block it; plain negamax negated C's win twice into a win for A
+        board = position(3, {11: 2, 12: 2, 13: 2, 14: 2}, [QUIET[0], QUIET[1], [15] + QUIET[2]])
+        self.assertEqual(board.owners, 3)
+        move, score, depth = AlphaBetaSolver(5.0, max_depth=4).solve(board)
+        self.assertFalse(is_proven(score) and score > 0)
+        self.assertEqual(score, -(WIN - 3))
+
+    def test_blocks_a_third_team(self):
+        # C needs cell 16 and A holds its card; any other move loses
+        board = position(3, {12: 2, 13: 2, 14: 2, 15: 2}, [[16] + QUIET[0], QUIET[1], [16] + QUIET[2]])
+        move, score, depth = AlphaBetaSolver(5.0, max_depth=4).solve(board)
+        self.assertEqual(move[1], 16)
+        self.assertFalse(is_proven(score) and score < 0)
+
+class MCTSSolverTest(EngineTest):
+    def test_plays_an_immediate_win(self):
+        board = position(2, {11: 0, 12: 0, 13: 0, 14: 0}, [[15] + QUIET[0], QUIET[1]])
+        policy = MCTSPolicy(0, 0.5)
+        try:
+            hand_index, board_index = policy.choose_move(board)
+        finally:
+            policy.close()
+        self.assertEqual(board_index, 15)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from random import Random
+import unittest
+
+from tests.games import EngineTest, any_move, fingerprint, positions, start
+
+class UndoTest(EngineTest):
+    def test_undo_restores_every_position(self):
+        for count in (2, 3, 4):
+            random = Random(count)
+            board = start(count, seed=count)
+            for position in positions(board, random, 120):
+                before = fingerprint(position)
+                move = any_move(position, random)
+                position.apply_move(move)
+                self.assertEqual(fingerprint(position.clone()), fingerprint(position))
+                position.undo_move()
+                self.assertEqual(fingerprint(position), before, (count, move))
+
+    def test_undo_after_a_dead_card(self):
+        # Discarding a dead card keeps the turn; undoing it must give the card back and keep the turn too
+        for seed in range(40):
+            random = Random(seed)
+            board = start(2, seed=seed)
+            for position in positions(board, random, 150):
+                dead = position.dead_cards()
+                if dead:
+                    before = fingerprint(position)
+                    position.apply_move((dead[0], None))
+                    position.undo_move()
+                    self.assertEqual(fingerprint(position), before)
+                    return
+        self.skipTest("nenhuma carta morta nas partidas sorteadas")
+
+if __name__ == "__main__":
+    unittest.main()
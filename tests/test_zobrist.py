@@ -0,0 +1,37 @@
+from __future__ import annotations
+import unittest
+
+from engine.zobrist import TranspositionCache
+
+class TranspositionCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = TranspositionCache(max_entries=3)
+        for key in "abc":
+            cache.put(key, key.upper())
+        # Reading a refreshes it, so b is now the oldest
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("d", "D")
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual([cache.get(key) for key in "acd"], ["A", "C", "D"])
+
+    def test_overwrite_refreshes_the_entry(self):
+        cache = TranspositionCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("a", 3)
+        cache.put("c", 4)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("a"), 3)
+
+    def test_counts_hits_and_misses(self):
+        cache = TranspositionCache(max_entries=2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+if __name__ == "__main__":
+    unittest.main()